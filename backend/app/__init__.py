@@ -10,7 +10,28 @@ ACCESS_TOKEN_EXPIRE_MINUTES = env.int("ACCESS_TOKEN_EXPIRE_MINUTES", 5)
 REFRESH_TOKEN_EXPIRE_MINUTES = env.int("REFRESH_TOKEN_EXPIRE_MINUTES", 160)
 VERIFICATION_TOKEN_EXPIRE_MINUTES = env.int("VERIFICATION_TOKEN_EXPIRE_MINUTES", 1440)
 RESEND_ACTIVATION_COOLDOWN_MINUTES = env.int("RESEND_ACTIVATION_COOLDOWN_MINUTES", 2)
+# Logging in once more evicts the least recently refreshed session beyond this many
+MAX_ACTIVE_SESSIONS_PER_USER = env.int("MAX_ACTIVE_SESSIONS_PER_USER", 10)
 DEBUG = env.bool("DEBUG", False)
+# Trust the signed access-token claims instead of loading the user on read-only requests; writes always load it
+STATELESS_AUTH = env.bool("STATELESS_AUTH", False)
+# In-process cache of user records looked up by the auth dependencies; a TTL of 0 disables it
+USER_CACHE_TTL_SECONDS = env.float("USER_CACHE_TTL_SECONDS", 0)
+USER_CACHE_MAX_SIZE = env.int("USER_CACHE_MAX_SIZE", 1024)
+# Companies are never updated by the app, so the name/id cache is on by default
+COMPANY_CACHE_TTL_SECONDS = env.float("COMPANY_CACHE_TTL_SECONDS", 3600)
+COMPANY_CACHE_MAX_SIZE = env.int("COMPANY_CACHE_MAX_SIZE", 4096)
+# Autocomplete suggestions may miss companies created within this window
+COMPANY_AUTOCOMPLETE_CACHE_TTL_SECONDS = env.float("COMPANY_AUTOCOMPLETE_CACHE_TTL_SECONDS", 60)
+# Worker threads for Argon2 hashing; extra logins queue instead of blocking the event loop
+PASSWORD_HASH_MAX_WORKERS = env.int("PASSWORD_HASH_MAX_WORKERS", 2)
+# Named Argon2 cost profile; the ARGON2_* values override individual parameters of it
+PASSWORD_HASH_PROFILE = env.str("PASSWORD_HASH_PROFILE", "recommended")
+ARGON2_TIME_COST = env.int("ARGON2_TIME_COST", None)
+ARGON2_MEMORY_COST = env.int("ARGON2_MEMORY_COST", None)
+ARGON2_PARALLELISM = env.int("ARGON2_PARALLELISM", None)
+# Serve connection-pool, cache and hashing-pool internals at /health/stats; the endpoint is unauthenticated
+HEALTH_STATS_ENABLED = env.bool("HEALTH_STATS_ENABLED", False)
 TOKEN_TYPE = "bearer"
 ALLOWED_HOSTS = env.list("ALLOWED_HOSTS", subcast=str)
 FRONTEND_ORIGIN = env.str("FRONTEND_ORIGIN")
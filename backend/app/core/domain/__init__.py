@@ -1,5 +1,7 @@
 from .application import (
     Application as Application,
+    ApplicationCounts as ApplicationCounts,
+    ApplicationWithCompany as ApplicationWithCompany,
     AppStatus as AppStatus,
     WorkLocation as WorkLocation,
     WorkType as WorkType,
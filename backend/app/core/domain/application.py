@@ -5,6 +5,8 @@ from datetime import datetime
 
 from pydantic import BaseModel
 
+from .company import Company
+
 
 class AppStatus(enum.Enum):
     APPLIED = "applied"
@@ -40,3 +42,14 @@ class Application(BaseModel):
     time_create: datetime | None = None
     time_update: datetime | None = None
     interview_date: datetime | None = None
+
+
+class ApplicationWithCompany(Application):
+    company: Company
+
+
+class ApplicationCounts(BaseModel):
+    by_status: dict[AppStatus, int]
+    by_work_type: dict[WorkType, int]
+    by_work_location: dict[WorkLocation, int]
+    by_week: dict[datetime, int]
@@ -1,9 +1,22 @@
 from .application import (
+    ApplicationBatchDeleteParams as ApplicationBatchDeleteParams,
+    ApplicationBatchDeleteResult as ApplicationBatchDeleteResult,
+    ApplicationBatchUpdate as ApplicationBatchUpdate,
     ApplicationCreate as ApplicationCreate,
+    ApplicationCursor as ApplicationCursor,
+    ApplicationExportRow as ApplicationExportRow,
+    ApplicationFileFormat as ApplicationFileFormat,
     ApplicationFilterParams as ApplicationFilterParams,
+    ApplicationImportError as ApplicationImportError,
+    ApplicationImportResult as ApplicationImportResult,
+    ApplicationImportRow as ApplicationImportRow,
     ApplicationRead as ApplicationRead,
     ApplicationReadWithCompany as ApplicationReadWithCompany,
+    ApplicationSearchParams as ApplicationSearchParams,
+    ApplicationStats as ApplicationStats,
+    ApplicationStatsParams as ApplicationStatsParams,
     ApplicationUpdate as ApplicationUpdate,
+    ApplicationWeeklyCount as ApplicationWeeklyCount,
 )
 from .auth import (
     AccessTokenPayload as AccessTokenPayload,
@@ -11,9 +24,11 @@ from .auth import (
     RefreshTokenPayload as RefreshTokenPayload,
     Token as Token,
     TokenType as TokenType,
+    UserSessionRead as UserSessionRead,
     VerificationTokenPayload as VerificationTokenPayload,
 )
 from .company import (
+    CompanyAutocompleteParams as CompanyAutocompleteParams,
     CompanyCreate as CompanyCreate,
     CompanyFilterParams as CompanyFilterParams,
     CompanyRead as CompanyRead,
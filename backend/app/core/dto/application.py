@@ -1,10 +1,12 @@
 from __future__ import annotations
 
-from datetime import datetime
+import binascii
+from base64 import urlsafe_b64decode, urlsafe_b64encode
+from datetime import date, datetime
 from enum import StrEnum
 from typing import Annotated
 
-from pydantic import Field
+from pydantic import Field, ValidationError, model_validator
 from typing_extensions import Literal
 
 from app.core.domain import AppStatus, WorkLocation, WorkType
@@ -22,6 +24,7 @@ TApplicationUrl = Annotated[str | None, Field(default=None)]
 TTimeCreate = datetime
 TTimeUpdate = datetime
 TInterviewDate = Annotated[datetime | None, Field(default=None)]
+TBatchIds = Annotated[list[TId], Field(min_length=1, max_length=100, description="Ids of the user's applications")]
 
 
 class ApplicationRead(BaseModelDTO):
@@ -65,11 +68,49 @@ class ApplicationUpdate(BaseModelDTO):
     interview_date: TInterviewDate
 
 
+class ApplicationBatchUpdate(BaseModelDTO):
+    ids: TBatchIds
+    changes: ApplicationUpdate
+
+    @model_validator(mode="after")
+    def validate_changes(self) -> ApplicationBatchUpdate:
+        if not self.changes.model_fields_set:
+            raise ValueError("At least one field must be changed")
+        return self
+
+
+class ApplicationBatchDeleteParams(BaseModelDTO):
+    ids: TBatchIds
+
+
+class ApplicationBatchDeleteResult(BaseModelDTO):
+    ids: list[TId] = Field(description="Ids of the deleted applications; ids the user does not own are skipped")
+
+
 class ApplicationOrderBy(StrEnum):
     time_create = "time_create"
     time_update = "time_update"
 
 
+class ApplicationCursor(BaseModelDTO):
+    """Keyset position of the last item on a page, encoded into an opaque string for clients."""
+
+    order_by: ApplicationOrderBy
+    order_direction: Literal["asc", "desc"]
+    value: datetime
+    id: TId
+
+    def encode(self) -> str:
+        return urlsafe_b64encode(self.model_dump_json().encode()).decode()
+
+    @classmethod
+    def decode(cls, cursor: str) -> ApplicationCursor:
+        try:
+            return cls.model_validate_json(urlsafe_b64decode(cursor.encode()))
+        except (binascii.Error, ValidationError) as e:
+            raise ValueError("Cursor is not valid") from e
+
+
 class ApplicationFilterParams(GenericFilterParams):
     order_by: ApplicationOrderBy = Field(ApplicationOrderBy.time_create)
     order_direction: Literal["asc", "desc"] = "desc"
@@ -78,3 +119,81 @@ class ApplicationFilterParams(GenericFilterParams):
     work_location: list[WorkLocation] | None = None
     role_name: str | None = None
     company_name: str | None = None
+    cursor: str | None = Field(
+        None,
+        description="Opaque cursor from a previous page's `next_cursor`. When set, `offset` is ignored",
+    )
+    include_total: bool = Field(
+        True,
+        description="Count all matching applications. Set to false to skip the count; `total` is then null",
+    )
+
+    @model_validator(mode="after")
+    def validate_cursor(self) -> ApplicationFilterParams:
+        if self.cursor is not None:
+            cursor = ApplicationCursor.decode(self.cursor)
+            if cursor.order_by != self.order_by or cursor.order_direction != self.order_direction:
+                raise ValueError("Cursor was issued for a different order_by or order_direction")
+        return self
+
+    @property
+    def page_cursor(self) -> ApplicationCursor | None:
+        return ApplicationCursor.decode(self.cursor) if self.cursor is not None else None
+
+
+class ApplicationSearchParams(BaseModelDTO):
+    query: str = Field(max_length=100, description="Text to fuzzy-match against role and company name")
+    limit: int = Field(10, ge=1, le=50, description="Number of items to return")
+
+
+class ApplicationFileFormat(StrEnum):
+    csv = "csv"
+    ndjson = "ndjson"
+
+
+class ApplicationImportRow(BaseModelDTO):
+    """One imported application; the company is given by name in a flat ``company`` column."""
+
+    role: TRole
+    company: Annotated[str, Field(min_length=1, max_length=40)]
+    status: TStatus = AppStatus.APPLIED
+    work_type: TWorkType = WorkType.FULL_TIME
+    work_location: TWorkLocation = WorkLocation.ON_SITE
+    note: TNote
+    application_url: TApplicationUrl
+    interview_date: TInterviewDate
+
+
+class ApplicationExportRow(ApplicationImportRow):
+    """Exported application; its extra columns are ignored when the file is imported again."""
+
+    id: TId
+    time_create: TTimeCreate
+    time_update: TTimeUpdate
+
+
+class ApplicationImportError(BaseModelDTO):
+    row: int = Field(description="Line number of the rejected row in the uploaded file")
+    detail: str
+
+
+class ApplicationImportResult(BaseModelDTO):
+    imported: int
+    errors: list[ApplicationImportError]
+
+
+class ApplicationStatsParams(BaseModelDTO):
+    weeks: int = Field(12, ge=1, le=52, description="Number of recent weeks, including the current one, in `weekly`")
+
+
+class ApplicationWeeklyCount(BaseModelDTO):
+    week_start: date = Field(description="Monday of the week (UTC)")
+    count: int
+
+
+class ApplicationStats(BaseModelDTO):
+    total: int
+    by_status: dict[TStatus, int]
+    by_work_type: dict[TWorkType, int]
+    by_work_location: dict[TWorkLocation, int]
+    weekly: list[ApplicationWeeklyCount]
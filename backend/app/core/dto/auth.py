@@ -4,6 +4,8 @@ from datetime import datetime
 from enum import StrEnum
 from typing import Literal
 
+from pydantic import Field
+
 from .config import BaseModelDTO
 
 
@@ -22,6 +24,8 @@ class Token[PayloadT: BaseModelDTO](BaseModelDTO):
 class AccessTokenPayload(BaseModelDTO):
     user_email: str
     user_id: int
+    is_active: bool | None = None
+    iat: datetime | None = None
     exp: datetime | None = None
     type: Literal[TokenType.access] = TokenType.access
 
@@ -43,3 +47,10 @@ class VerificationTokenPayload(BaseModelDTO):
 class AccessTokenResponse(BaseModelDTO):
     access_token: str
     token_type: str = "bearer"
+
+
+class UserSessionRead(BaseModelDTO):
+    id: int
+    time_create: datetime = Field(description="When the session's current refresh token was issued")
+    expires_at: datetime
+    current: bool = Field(description="Whether this is the session of the refresh cookie sent with the request")
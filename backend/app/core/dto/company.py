@@ -26,3 +26,8 @@ class CompanyFilterParams(GenericFilterParams):
     order_by: CompanyOrderBy = CompanyOrderBy.company_name
     order_direction: Literal["asc", "desc"] = "desc"
     name_contains: str | None = None
+
+
+class CompanyAutocompleteParams(BaseModelDTO):
+    prefix: str = Field(min_length=1, max_length=40, description="Case-insensitive start of the company name")
+    limit: int = Field(10, ge=1, le=20, description="Number of suggestions to return")
@@ -34,7 +34,8 @@ class GenericFilterParams(BaseModelDTO):
 
 class PaginatedResponse[T](BaseModelDTO):
     items: list[T]
-    total: int
+    total: int | None
     limit: int
     offset: int
     has_more: bool
+    next_cursor: str | None = None
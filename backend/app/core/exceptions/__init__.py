@@ -1,4 +1,7 @@
-from .application import ApplicationNotFoundError as ApplicationNotFoundError
+from .application import (
+    ApplicationImportLimitError as ApplicationImportLimitError,
+    ApplicationNotFoundError as ApplicationNotFoundError,
+)
 from .auth import (
     RefreshTokenReuseError as RefreshTokenReuseError,
     RefreshTokenRevokedError as RefreshTokenRevokedError,
@@ -1,5 +1,9 @@
-from .generic import NotFoundError
+from .generic import BaseExceptionError, NotFoundError
 
 
 class ApplicationNotFoundError(NotFoundError):
     pass
+
+
+class ApplicationImportLimitError(BaseExceptionError):
+    pass
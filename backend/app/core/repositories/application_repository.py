@@ -1,8 +1,9 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
+from collections.abc import AsyncIterator
 
-from app.core.domain import Application
+from app.core.domain import Application, ApplicationCounts, ApplicationWithCompany
 from app.core.dto import ApplicationFilterParams
 
 
@@ -11,16 +12,47 @@ class IApplicationRepository(ABC):
     async def create(self, application: Application) -> Application: ...
 
     @abstractmethod
-    async def get_by_user_email(self, email: str, filter_param: ApplicationFilterParams) -> list[Application]: ...
+    async def create_many(self, applications: list[Application]) -> int: ...
 
     @abstractmethod
-    async def count_by_user_email(self, email: str, filter_param: ApplicationFilterParams) -> int: ...
+    async def get_by_user_id(
+        self, user_id: int, filter_param: ApplicationFilterParams, limit: int | None = None
+    ) -> list[ApplicationWithCompany]: ...
 
     @abstractmethod
-    async def get_by_id(self, application_id: int) -> Application | None: ...
+    async def count_by_user_id(self, user_id: int, filter_param: ApplicationFilterParams) -> int: ...
 
     @abstractmethod
-    async def update(self, application_id: int, **update_data) -> Application: ...
+    def stream_by_user_id(self, user_id: int) -> AsyncIterator[ApplicationWithCompany]:
+        """Yield all of the user's applications without materializing them as a list."""
 
     @abstractmethod
-    async def delete(self, application_id: int) -> None: ...
+    async def get_counts(self, user_id: int) -> ApplicationCounts:
+        """Count the user's applications per status, work type, work location and week."""
+
+    @abstractmethod
+    async def search(self, user_id: int, query: str, limit: int) -> list[ApplicationWithCompany]: ...
+
+    @abstractmethod
+    async def get_by_id(self, application_id: int, user_id: int | None = None) -> Application | None:
+        """Get an application, only if it belongs to ``user_id`` when that is given."""
+
+    @abstractmethod
+    async def get_owner_id(self, application_id: int) -> int | None:
+        """Get the id of the user who owns the application, or None if it does not exist."""
+
+    @abstractmethod
+    async def update(self, application_id: int, user_id: int, **update_data) -> Application | None:
+        """Update the application if it belongs to ``user_id``, otherwise return None."""
+
+    @abstractmethod
+    async def update_many(self, user_id: int, application_ids: list[int], **update_data) -> list[Application]:
+        """Update the user's applications among ``application_ids``; ids of other users are skipped."""
+
+    @abstractmethod
+    async def delete(self, application_id: int, user_id: int) -> bool:
+        """Delete the application if it belongs to ``user_id`` and tell whether it was deleted."""
+
+    @abstractmethod
+    async def delete_many(self, user_id: int, application_ids: list[int]) -> list[int]:
+        """Delete the user's applications among ``application_ids`` and return the deleted ids."""
@@ -14,6 +14,13 @@ class ICompanyRepository(ABC):
     @abstractmethod
     async def get_by_name(self, name: str) -> Company | None: ...
 
+    @abstractmethod
+    async def get_or_create(self, name: str) -> Company: ...
+
+    @abstractmethod
+    async def get_or_create_many(self, names: Iterable[str]) -> dict[str, int]:
+        """Map each name to its company id, creating the companies that don't exist yet."""
+
     @abstractmethod
     async def get_by_id(self, company_id: int) -> Company | None: ...
 
@@ -29,3 +36,6 @@ class ICompanyRepository(ABC):
 
     @abstractmethod
     async def get_by_user_id(self, user_id: int, filter_param: CompanyFilterParams) -> list[Company]: ...
+
+    @abstractmethod
+    async def autocomplete(self, prefix: str, limit: int) -> list[Company]: ...
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
+from datetime import datetime
 
 from app.core.domain import RefreshToken
 
@@ -23,29 +24,67 @@ class IRefreshTokenRepository(ABC):
         """Retrieve a refresh token by its ID."""
         ...
 
+    @abstractmethod
+    async def get_active_for_user(self, user_id: int) -> list[RefreshToken]:
+        """Retrieve the user's live tokens (one per active session), most recently issued first."""
+        ...
+
     @abstractmethod
     async def mark_used(self, token_id: int) -> RefreshToken | None:
         """Mark a token as used (for rotation)."""
         ...
 
+    @abstractmethod
+    async def rotate(
+        self, token_hash: str, new_token_hash: str, expires_at: datetime, user_id: int | None = None
+    ) -> RefreshToken | None:
+        """Mark a live token as used and create its child token atomically.
+
+        Only a token that is not used, revoked or expired (and belongs to ``user_id`` when given)
+        is rotated. Returns the new token, or None if no token was rotated.
+        """
+        ...
+
     @abstractmethod
     async def revoke(self, token_id: int) -> RefreshToken | None:
         """Revoke a single token by ID."""
         ...
 
     @abstractmethod
-    async def revoke_token_family(self, family_id: str) -> None:
-        """Revoke an entire token family by family_id.
+    async def revoke_oldest_sessions(self, user_id: int, keep: int) -> int:
+        """Revoke the user's live tokens beyond the ``keep`` most recently issued ones.
+
+        Returns the number of revoked tokens.
+        """
+        ...
+
+    @abstractmethod
+    async def revoke_token_family(self, family_id: str) -> int:
+        """Revoke the live tokens of a token family by family_id.
 
         This is used when token reuse is detected - all tokens in the family
-        should be revoked to prevent further abuse.
+        should be revoked to prevent further abuse. Tokens that are already
+        revoked or expired are left untouched.
+
+        Returns the number of revoked tokens.
         """
         ...
 
     @abstractmethod
-    async def revoke_all_for_user(self, user_id: int) -> None:
-        """Revoke all tokens for a specific user.
+    async def revoke_all_for_user(self, user_id: int) -> int:
+        """Revoke the live tokens of a specific user.
 
         Used when user changes password, logs out from all devices, or is deactivated.
+        Tokens that are already revoked or expired are left untouched.
+
+        Returns the number of revoked tokens.
+        """
+        ...
+
+    @abstractmethod
+    async def delete_stale(self, before: datetime, limit: int) -> int:
+        """Delete up to ``limit`` tokens that expired or were revoked before ``before``.
+
+        Returns the number of deleted tokens; callers repeat until it is below ``limit``.
         """
         ...
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
+from datetime import datetime
 
 from app.core.domain import VerificationToken
 
@@ -11,6 +12,16 @@ class IVerificationTokenRepository(ABC):
     @abstractmethod
     async def create(self, token: VerificationToken) -> VerificationToken: ...
 
+    @abstractmethod
+    async def replace_for_user(
+        self, token: VerificationToken, replace_before: datetime | None = None
+    ) -> datetime | None:
+        """Store ``token`` as the user's only verification token, replacing any previous one.
+
+        With ``replace_before``, an existing token created at or after it is kept and nothing is written.
+        Returns the creation time of the kept token, or None if ``token`` was stored.
+        """
+
     @abstractmethod
     async def get_by_hash(self, token_hash: str) -> VerificationToken | None: ...
 
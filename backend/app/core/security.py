@@ -1,6 +1,6 @@
 from abc import ABC, abstractmethod
 
-from app.core.dto import BaseModelDTO, Token
+from app.core.dto import AccessTokenPayload, BaseModelDTO, Token
 
 
 class IPasswordHasher(ABC):
@@ -10,6 +10,22 @@ class IPasswordHasher(ABC):
     @abstractmethod
     def verify(self, raw_password: str, hashed_password: str) -> bool: ...
 
+    @abstractmethod
+    def verify_and_update(self, raw_password: str, hashed_password: str) -> tuple[bool, str | None]:
+        """Verify and return a new hash when the stored one uses outdated parameters."""
+
+    @abstractmethod
+    async def hash_async(self, password: str) -> str:
+        """Hash without blocking the event loop."""
+
+    @abstractmethod
+    async def verify_async(self, raw_password: str, hashed_password: str) -> bool:
+        """Verify without blocking the event loop."""
+
+    @abstractmethod
+    async def verify_and_update_async(self, raw_password: str, hashed_password: str) -> tuple[bool, str | None]:
+        """Verify and rehash without blocking the event loop."""
+
 
 class ITokenStrategy[PayloadT: BaseModelDTO](ABC):
     @abstractmethod
@@ -17,3 +33,15 @@ class ITokenStrategy[PayloadT: BaseModelDTO](ABC):
 
     @abstractmethod
     def verify_token(self, token: str) -> Token[PayloadT]: ...
+
+
+class IAccessTokenDenyList(ABC):
+    """Revocation record for access tokens that are trusted without a database lookup."""
+
+    @abstractmethod
+    def deny_user(self, user_id: int) -> None:
+        """Reject every access token issued to the user before this call."""
+        ...
+
+    @abstractmethod
+    def is_denied(self, payload: AccessTokenPayload) -> bool: ...
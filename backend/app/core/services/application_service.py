@@ -1,24 +1,41 @@
 from __future__ import annotations
 
 import asyncio
-from datetime import datetime
+from collections.abc import AsyncIterator, Iterable
+from datetime import UTC, datetime, timedelta
+from typing import Any
 
-from app.core.domain import Application, Company
+from pydantic import ValidationError
+
+from app.core.domain import Application, AppStatus, WorkLocation, WorkType
 from app.core.dto import (
+    ApplicationBatchDeleteParams,
+    ApplicationBatchUpdate,
     ApplicationCreate,
+    ApplicationCursor,
+    ApplicationExportRow,
     ApplicationFilterParams,
+    ApplicationImportError,
+    ApplicationImportResult,
+    ApplicationImportRow,
     ApplicationRead,
     ApplicationReadWithCompany,
+    ApplicationSearchParams,
+    ApplicationStats,
+    ApplicationStatsParams,
     ApplicationUpdate,
-    CompanyRead,
+    ApplicationWeeklyCount,
 )
-from app.core.exceptions import ApplicationNotFoundError, UserNotAuthorizedError
+from app.core.exceptions import ApplicationImportLimitError, ApplicationNotFoundError, UserNotAuthorizedError
 from app.core.repositories import (
     IApplicationRepository,
     ICompanyRepository,
     IUserRepository,
 )
 
+IMPORT_MAX_ROWS = 5000
+IMPORT_BATCH_SIZE = 500
+
 
 class ApplicationService:
     def __init__(
@@ -31,32 +48,66 @@ class ApplicationService:
         self.user_repo = user_repo
         self.company_repo = company_repo
 
-    async def get_applications_by_user_email(
-        self, email: str, filter_param: ApplicationFilterParams
-    ) -> tuple[list[ApplicationReadWithCompany], int, bool]:
-        applications, total = await asyncio.gather(
-            self.app_repo.get_by_user_email(email, filter_param),
-            self.app_repo.count_by_user_email(email, filter_param),
-        )
-        has_more = filter_param.offset + len(applications) < total
+    async def get_applications_by_user_id(
+        self, user_id: int, filter_param: ApplicationFilterParams
+    ) -> tuple[list[ApplicationReadWithCompany], int | None, bool, str | None]:
+        total: int | None
+        if filter_param.cursor is None and filter_param.include_total:
+            applications, count = await asyncio.gather(
+                self.app_repo.get_by_user_id(user_id, filter_param),
+                self.app_repo.count_by_user_id(user_id, filter_param),
+            )
+            total = count
+            has_more = filter_param.offset + len(applications) < count
+        else:
+            # Without a usable total (cursor mode or count skipped), fetch one extra row to detect a next page
+            get_page = self.app_repo.get_by_user_id(user_id, filter_param, limit=filter_param.limit + 1)
+            if filter_param.include_total:
+                applications, total = await asyncio.gather(
+                    get_page, self.app_repo.count_by_user_id(user_id, filter_param)
+                )
+            else:
+                applications, total = await get_page, None
+            has_more = len(applications) > filter_param.limit
+            applications = applications[: filter_param.limit]
         if not applications:
-            return [], total, has_more
-        companies_ids = {app.company_id for app in applications}
-        companies = await self.company_repo.get_by_ids(companies_ids)
-        companies_dict = {company.id: company for company in companies}
+            return [], total, has_more, None
+        next_cursor = self._next_cursor(applications[-1], filter_param) if has_more else None
         application_with_company = [
-            ApplicationReadWithCompany(
-                **app.model_dump(),
-                company=CompanyRead.model_validate(companies_dict[app.company_id]),
-            )
-            for app in applications
+            ApplicationReadWithCompany.model_validate(app, from_attributes=True) for app in applications
         ]
-        return application_with_company, total, has_more
+        return application_with_company, total, has_more, next_cursor
+
+    async def search(self, user_id: int, search_param: ApplicationSearchParams) -> list[ApplicationReadWithCompany]:
+        applications = await self.app_repo.search(user_id, search_param.query, search_param.limit)
+        return [ApplicationReadWithCompany.model_validate(app, from_attributes=True) for app in applications]
+
+    async def get_stats(self, user_id: int, stats_param: ApplicationStatsParams) -> ApplicationStats:
+        counts = await self.app_repo.get_counts(user_id)
+        today = datetime.now(UTC).date()
+        current_week = today - timedelta(days=today.weekday())
+        by_week = {week.date(): count for week, count in counts.by_week.items()}
+        weeks = (current_week - timedelta(weeks=n) for n in reversed(range(stats_param.weeks)))
+        return ApplicationStats(
+            total=sum(counts.by_status.values()),
+            by_status={status: counts.by_status.get(status, 0) for status in AppStatus},
+            by_work_type={work_type: counts.by_work_type.get(work_type, 0) for work_type in WorkType},
+            by_work_location={location: counts.by_work_location.get(location, 0) for location in WorkLocation},
+            weekly=[ApplicationWeeklyCount(week_start=week, count=by_week.get(week, 0)) for week in weeks],
+        )
+
+    @staticmethod
+    def _next_cursor(last_app: Application, filter_param: ApplicationFilterParams) -> str:
+        assert last_app.id is not None, "Application ID must be set to build a cursor"
+        return ApplicationCursor(
+            order_by=filter_param.order_by,
+            order_direction=filter_param.order_direction,
+            value=getattr(last_app, filter_param.order_by),
+            id=last_app.id,
+        ).encode()
 
     async def create(self, app: ApplicationCreate, user_id: int):
-        company = await self.company_repo.get_by_name(app.company.name)
-        if company is None:
-            company = await self.company_repo.create(Company.model_validate(app.company, from_attributes=True))
+        company = await self.company_repo.get_or_create(app.company.name)
         app_dict = app.model_dump()
         app_dict.update({"company_id": company.id})
         app_dict.update({"user_id": user_id})
@@ -64,46 +115,111 @@ class ApplicationService:
 
         return ApplicationRead.model_validate(application, from_attributes=True)
 
+    async def export_applications(self, user_id: int) -> AsyncIterator[ApplicationExportRow]:
+        async for app in self.app_repo.stream_by_user_id(user_id):
+            yield ApplicationExportRow.model_validate(
+                {**app.model_dump(exclude={"company", "company_id", "user_id"}), "company": app.company.name}
+            )
+
+    async def import_applications(
+        self, user_id: int, rows: Iterable[tuple[int, dict[str, Any] | str]]
+    ) -> ApplicationImportResult:
+        """Import ``(line number, row)`` pairs, where a row is a parsed mapping or a raw JSON string.
+
+        Invalid rows are reported and skipped; valid ones are written in batches, each resolving
+        its companies with a single lookup and inserting its applications in one statement.
+        """
+        imported = 0
+        errors: list[ApplicationImportError] = []
+        batch: list[ApplicationImportRow] = []
+        for row_count, (line, raw) in enumerate(rows, start=1):
+            if row_count > IMPORT_MAX_ROWS:
+                raise ApplicationImportLimitError(f"Import is limited to {IMPORT_MAX_ROWS} rows")
+            try:
+                row = (
+                    ApplicationImportRow.model_validate_json(raw)
+                    if isinstance(raw, str)
+                    else ApplicationImportRow.model_validate(raw)
+                )
+            except ValidationError as e:
+                errors.append(ApplicationImportError(row=line, detail=self._format_validation_error(e)))
+                continue
+            batch.append(row)
+            if len(batch) == IMPORT_BATCH_SIZE:
+                imported += await self._import_batch(user_id, batch)
+                batch = []
+        imported += await self._import_batch(user_id, batch)
+        return ApplicationImportResult(imported=imported, errors=errors)
+
+    async def _import_batch(self, user_id: int, rows: list[ApplicationImportRow]) -> int:
+        if not rows:
+            return 0
+        company_ids = await self.company_repo.get_or_create_many(row.company for row in rows)
+        applications = [
+            Application(**row.model_dump(exclude={"company"}), company_id=company_ids[row.company], user_id=user_id)
+            for row in rows
+        ]
+        return await self.app_repo.create_many(applications)
+
+    @staticmethod
+    def _format_validation_error(error: ValidationError) -> str:
+        return "; ".join(
+            f"{'.'.join(str(part) for part in err['loc']) or 'row'}: {err['msg']}"
+            for err in error.errors(include_url=False)
+        )
+
     async def update(self, application_id: int, app: ApplicationUpdate, user_id: int) -> ApplicationRead:
-        existing_app = await self.app_repo.get_by_id(application_id)
-        if not existing_app:
-            raise ApplicationNotFoundError(f"Application with {application_id} id is not found")
+        update_data = await self._get_update_data(app)
+        if not update_data:
+            existing_app = await self.app_repo.get_by_id(application_id, user_id)
+            if not existing_app:
+                raise await self._ownership_error(application_id, user_id, "update")
+            return ApplicationRead.model_validate(existing_app, from_attributes=True)
 
-        if existing_app.user_id != user_id:
-            raise UserNotAuthorizedError(f"User with {user_id} id is not authorized to update this application")
+        updated_app = await self.app_repo.update(application_id, user_id, **update_data)
+        if not updated_app:
+            raise await self._ownership_error(application_id, user_id, "update")
+
+        return ApplicationRead.model_validate(updated_app, from_attributes=True)
+
+    async def update_many(self, batch: ApplicationBatchUpdate, user_id: int) -> list[ApplicationRead]:
+        """Apply the same changes to several applications. Ids the user does not own are skipped."""
+        update_data = await self._get_update_data(batch.changes)
+        updated_apps = await self.app_repo.update_many(user_id, batch.ids, **update_data)
+        return [ApplicationRead.model_validate(app, from_attributes=True) for app in updated_apps]
+
+    async def _get_update_data(self, app: ApplicationUpdate) -> dict[str, Any]:
         update_data = app.model_dump(exclude_unset=True)
         if not update_data:
-            return ApplicationRead.model_validate(existing_app, from_attributes=True)
+            return update_data
 
         if update_data.get("company"):
-            company = await self.company_repo.get_by_name(update_data["company"]["name"])
-            if company is None:
-                company = await self.company_repo.create(Company(name=update_data["company"]["name"]))
+            company = await self.company_repo.get_or_create(update_data["company"]["name"])
             update_data["company_id"] = company.id
             update_data.pop("company")
         update_data["time_update"] = datetime.now()
-
-        updated_app = await self.app_repo.update(application_id, **update_data)
-
-        return ApplicationRead.model_validate(updated_app, from_attributes=True)
+        return update_data
 
     async def get_by_id(self, application_id: int, user_id: int) -> ApplicationRead:
         """Get a single application by ID. User can only access their own applications."""
-        existing_app = await self.app_repo.get_by_id(application_id)
+        existing_app = await self.app_repo.get_by_id(application_id, user_id)
         if not existing_app:
-            raise ApplicationNotFoundError(f"Application with {application_id} id is not found")
-
-        if existing_app.user_id != user_id:
-            raise UserNotAuthorizedError(f"User with {user_id} id is not authorized to access this application")
+            raise await self._ownership_error(application_id, user_id, "access")
 
         return ApplicationRead.model_validate(existing_app, from_attributes=True)
 
     async def delete(self, application_id: int, user_id: int) -> None:
-        existing_app = await self.app_repo.get_by_id(application_id)
-        if not existing_app:
-            raise ApplicationNotFoundError(f"Application with {application_id} id is not found")
-
-        if existing_app.user_id != user_id:
-            raise UserNotAuthorizedError(f"User with {user_id} id is not authorized to delete this application")
-
-        await self.app_repo.delete(application_id)
+        if not await self.app_repo.delete(application_id, user_id):
+            raise await self._ownership_error(application_id, user_id, "delete")
+
+    async def _ownership_error(
+        self, application_id: int, user_id: int, action: str
+    ) -> ApplicationNotFoundError | UserNotAuthorizedError:
+        """Tell a missing application from another user's one, after a user-scoped statement matched no row."""
+        if await self.app_repo.get_owner_id(application_id) is None:
+            return ApplicationNotFoundError(f"Application with {application_id} id is not found")
+        return UserNotAuthorizedError(f"User with {user_id} id is not authorized to {action} this application")
+
+    async def delete_many(self, params: ApplicationBatchDeleteParams, user_id: int) -> list[int]:
+        """Delete several applications. Ids the user does not own are skipped."""
+        return await self.app_repo.delete_many(user_id, params.ids)
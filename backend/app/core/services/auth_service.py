@@ -34,11 +34,17 @@ class AuthService:
                 "This account uses OAuth authentication. Please sign in with your OAuth provider or set a password first."
             )
 
-        if not self.password_hasher.verify(user_creds.password, user.password):
+        is_valid, updated_hash = await self.password_hasher.verify_and_update_async(user_creds.password, user.password)
+        if not is_valid:
             raise InvalidPasswordError("Incorrect password")
+        # Move the stored hash to the current cost profile while the raw password is at hand
+        if updated_hash is not None:
+            await self.user_repo.update(user.id, password=updated_hash)
 
         # Generate access token
-        access_token = self.access_strategy.create_token(AccessTokenPayload(user_email=user.email, user_id=user.id))
+        access_token = self.access_strategy.create_token(
+            AccessTokenPayload(user_email=user.email, user_id=user.id, is_active=user.is_active)
+        )
 
         # Issue a new refresh token (stored in database)
         raw_refresh_token = await self.refresh_token_service.issue(user.id)
@@ -82,7 +88,9 @@ class AuthService:
             raise UserNotFoundError(f"User with id {token_user_id} does not exist")  # noqa: EM102
 
         # Generate new access token
-        new_access_token = self.access_strategy.create_token(AccessTokenPayload(user_email=user.email, user_id=user.id))
+        new_access_token = self.access_strategy.create_token(
+            AccessTokenPayload(user_email=user.email, user_id=user.id, is_active=user.is_active)
+        )
 
         # Create new refresh token response object with payload metadata
         new_refresh_token = Token(
@@ -97,6 +105,6 @@ class AuthService:
         """Revoke the provided refresh token."""
         await self.refresh_token_service.revoke(refresh_token)
 
-    async def logout_all_devices(self, user_id: int) -> None:
-        """Revoke all refresh tokens for a user (logout from all devices)."""
-        await self.refresh_token_service.revoke_all_for_user(user_id)
+    async def logout_all_devices(self, user_id: int) -> int:
+        """Revoke all refresh tokens for a user (logout from all devices) and return how many were live."""
+        return await self.refresh_token_service.revoke_all_for_user(user_id)
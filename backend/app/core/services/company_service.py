@@ -1,4 +1,4 @@
-from app.core.dto import CompanyFilterParams, CompanyRead
+from app.core.dto import CompanyAutocompleteParams, CompanyFilterParams, CompanyRead
 from app.core.exceptions import CompanyNotFoundError
 from app.core.repositories import ICompanyRepository
 
@@ -16,3 +16,7 @@ class CompanyService:
     async def get_companies_by_user_id(self, user_id: int, filter_param: CompanyFilterParams) -> list[CompanyRead]:
         companies = await self.company_repo.get_by_user_id(user_id, filter_param)
         return [CompanyRead.model_validate(company, from_attributes=True) for company in companies]
+
+    async def autocomplete(self, params: CompanyAutocompleteParams) -> list[CompanyRead]:
+        companies = await self.company_repo.autocomplete(params.prefix, params.limit)
+        return [CompanyRead.model_validate(company, from_attributes=True) for company in companies]
@@ -122,7 +122,9 @@ class OAuthService:
             raise ValueError("User ID is required to issue tokens")
 
         # Generate access token
-        access_token = self.access_strategy.create_token(AccessTokenPayload(user_email=user.email, user_id=user.id))
+        access_token = self.access_strategy.create_token(
+            AccessTokenPayload(user_email=user.email, user_id=user.id, is_active=user.is_active)
+        )
 
         # Issue a new refresh token (stored in database)
         raw_refresh_token = await self.refresh_token_service.issue(user.id)
@@ -2,11 +2,13 @@ from __future__ import annotations
 
 import hashlib
 import hmac
+import logging
 import secrets
 from datetime import UTC, datetime, timedelta
 
-from app import REFRESH_TOKEN_EXPIRE_MINUTES, SECRET_KEY
+from app import MAX_ACTIVE_SESSIONS_PER_USER, REFRESH_TOKEN_EXPIRE_MINUTES, SECRET_KEY
 from app.core.domain import RefreshToken
+from app.core.dto import UserSessionRead
 from app.core.exceptions import (
     RefreshTokenReuseError,
     RefreshTokenRevokedError,
@@ -14,6 +16,9 @@ from app.core.exceptions import (
     TokenInvalidError,
 )
 from app.core.repositories import IRefreshTokenRepository
+from app.core.security import IAccessTokenDenyList
+
+logger = logging.getLogger(__name__)
 
 
 class RefreshTokenService:
@@ -29,10 +34,14 @@ class RefreshTokenService:
         repo: IRefreshTokenRepository,
         secret_key: str = SECRET_KEY,
         default_expire_minutes: int = REFRESH_TOKEN_EXPIRE_MINUTES,
+        access_token_deny_list: IAccessTokenDenyList | None = None,
+        max_active_sessions: int = MAX_ACTIVE_SESSIONS_PER_USER,
     ) -> None:
         self.repo = repo
         self.secret_key = secret_key
         self.default_expire_minutes = default_expire_minutes
+        self.access_token_deny_list = access_token_deny_list
+        self.max_active_sessions = max_active_sessions
 
     def _hash(self, raw_token: str) -> str:
         """Generate a secure hash of the token for storage."""
@@ -51,6 +60,9 @@ class RefreshTokenService:
     ) -> str:
         """Issue a new refresh token for a user.
 
+        Issuing a root token starts a new session; the user's least recently refreshed sessions
+        beyond ``max_active_sessions`` are revoked in the same transaction.
+
         Args:
             user_id: The user ID to issue the token for
             family_id: Optional family ID. If None, generates a new family ID (root token)
@@ -65,6 +77,7 @@ class RefreshTokenService:
         token_hash = self._hash(raw)
 
         # Generate new family_id if not provided (root token)
+        is_new_session = family_id is None
         if family_id is None:
             family_id = self._generate_family_id()
 
@@ -76,6 +89,8 @@ class RefreshTokenService:
             parent_token_id=parent_token_id,
         )
         await self.repo.create(domain_obj)
+        if is_new_session and self.max_active_sessions > 0:
+            await self.repo.revoke_oldest_sessions(user_id, keep=self.max_active_sessions)
         return raw
 
     async def validate_and_rotate(self, raw_token: str, user_id: int | None = None) -> tuple[str, int]:
@@ -100,6 +115,14 @@ class RefreshTokenService:
             RefreshTokenReuseError: Token has been used (potential attack)
         """
         token_hash = self._hash(raw_token)
+        new_raw_token = secrets.token_urlsafe(32)
+        expires_at = datetime.now(UTC) + timedelta(minutes=self.default_expire_minutes)
+        # Mark the current token as used and issue its child in the same family in one statement
+        new_token = await self.repo.rotate(token_hash, self._hash(new_raw_token), expires_at, user_id)
+        if new_token is not None:
+            return new_raw_token, new_token.user_id
+
+        # Nothing was rotated: look the token up only to report why
         token = await self.repo.get_by_hash(token_hash)
 
         if token is None:
@@ -120,17 +143,36 @@ class RefreshTokenService:
         if token.is_used():
             # Security breach detected: token reuse
             # Revoke the entire token family to prevent further abuse
-            await self.repo.revoke_token_family(token.family_id)
+            revoked = await self.repo.revoke_token_family(token.family_id)
+            logger.warning(
+                "Refresh token reuse for user %s: revoked %s live tokens of family %s",
+                token.user_id,
+                revoked,
+                token.family_id,
+            )
             raise RefreshTokenReuseError("Token has already been used. Token family revoked for security.")
 
-        # Mark the current token as used
-        if token.id is not None:
-            await self.repo.mark_used(token.id)
+        # Defensive: a live token is always rotated above
+        raise TokenInvalidError("Token is not valid")
 
-        # Issue a new token with the same family_id and current token as parent
-        # Use token.user_id from the validated token
-        new_raw_token = await self.issue(token.user_id, family_id=token.family_id, parent_token_id=token.id)
-        return new_raw_token, token.user_id
+    async def list_sessions(self, user_id: int, raw_token: str | None = None) -> list[UserSessionRead]:
+        """List the user's active sessions, most recently refreshed first.
+
+        Args:
+            user_id: The user ID whose sessions should be listed
+            raw_token: Optional refresh token of the caller, used to flag the current session
+        """
+        current_hash = self._hash(raw_token) if raw_token else None
+        return [
+            UserSessionRead(
+                id=token.id,
+                time_create=token.time_create,
+                expires_at=token.expires_at,
+                current=token.token_hash == current_hash,
+            )
+            for token in await self.repo.get_active_for_user(user_id)
+            if token.id is not None
+        ]
 
     async def revoke(self, raw_token: str) -> None:
         """Revoke a single refresh token.
@@ -143,12 +185,24 @@ class RefreshTokenService:
         if token and token.id is not None:
             await self.repo.revoke(token.id)
 
-    async def revoke_all_for_user(self, user_id: int) -> None:
-        """Revoke all refresh tokens for a user.
+    async def revoke_all_for_user(self, user_id: int) -> int:
+        """Revoke all live refresh tokens for a user.
 
         Used when user changes password, logs out from all devices, or is deactivated.
+        Access tokens already handed out are denied as well, so they stop working before they expire.
 
         Args:
             user_id: The user ID whose tokens should be revoked
+
+        Returns:
+            The number of refresh tokens that were revoked
         """
-        await self.repo.revoke_all_for_user(user_id)
+        revoked = await self.repo.revoke_all_for_user(user_id)
+        logger.info("Revoked %s live refresh tokens of user %s", revoked, user_id)
+        self.deny_access_tokens(user_id)
+        return revoked
+
+    def deny_access_tokens(self, user_id: int) -> None:
+        """Reject the user's outstanding access tokens where they are trusted without a user lookup."""
+        if self.access_token_deny_list is not None:
+            self.access_token_deny_list.deny_user(user_id)
@@ -30,17 +30,19 @@ class UserEmailService:
         self.verification_token_service = verification_token_service
         self.template_loader = TemplateLoader()
 
-    async def send_verification_email(self, user: UserRead) -> bool:
+    async def send_verification_email(self, user: UserRead, raw_token: str | None = None) -> bool:
         """Send email verification message to user.
 
         Args:
             user: User object containing email, ID, and optional first name
+            raw_token: Verification token already issued for the user; a new one is issued if None
 
         Returns:
             bool: True if email was sent successfully, False otherwise
         """
-        assert user.id is not None, "User ID must be set to issue verification token"
-        raw_token = await self.verification_token_service.issue(user.id)
+        if raw_token is None:
+            assert user.id is not None, "User ID must be set to issue verification token"
+            raw_token = await self.verification_token_service.issue(user.id)
         verification_url = f"{FRONTEND_ORIGIN}/verify-email?token={raw_token}"
 
         context = {
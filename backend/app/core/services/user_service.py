@@ -3,7 +3,6 @@ from app.core.dto import AccessTokenPayload, UserChangePassword, UserCreate, Use
 from app.core.exceptions import (
     InactiveUserAlreadyExistError,
     InvalidPasswordError,
-    RateLimitExceededError,
     UserAlreadyActivatedError,
     UserAlreadyExistError,
     UserNotFoundError,
@@ -36,7 +35,7 @@ class UserService:
             if not existing_user.is_active:
                 raise InactiveUserAlreadyExistError("Inactive user already exists")
             raise UserAlreadyExistError("User already exists")
-        hashed_password = self.password_hasher.hash(user_data.password)
+        hashed_password = await self.password_hasher.hash_async(user_data.password)
         user = await self.user_repo.create(User(email=user_data.email, password=hashed_password))
         return UserRead.model_validate(user, from_attributes=True)
 
@@ -71,10 +70,10 @@ class UserService:
         if user.password is None:
             raise InvalidPasswordError("This account uses OAuth authentication and does not have a password")
 
-        if not self.password_hasher.verify(passwords.old_password, user.password):
+        if not await self.password_hasher.verify_async(passwords.old_password, user.password):
             raise InvalidPasswordError("Old password is incorrect")
 
-        new_hashed_password = self.password_hasher.hash(passwords.new_password)
+        new_hashed_password = await self.password_hasher.hash_async(passwords.new_password)
         updated_user = await self.user_repo.update(user.id, password=new_hashed_password)
         if updated_user is None:
             raise UserNotFoundError("Failed to update user")
@@ -108,7 +107,7 @@ class UserService:
         if user.password is not None:
             raise InvalidPasswordError("This account already has a password. Use change password instead.")
 
-        new_hashed_password = self.password_hasher.hash(passwords)
+        new_hashed_password = await self.password_hasher.hash_async(passwords)
         updated_user = await self.user_repo.update(user.id, password=new_hashed_password)
         if updated_user is None:
             raise UserNotFoundError("Failed to update user")
@@ -147,22 +146,25 @@ class UserService:
         if not deleted:
             raise UserNotFoundError(f"User with id {user_id} not found")
 
-    async def resend_activation_email(self, email: str, cooldown_minutes: int = 2) -> UserRead:
-        """Resend activation email to user if they haven't activated their account yet.
+        # Refresh tokens are removed by the cascade, but stateless access tokens must be denied explicitly
+        self.refresh_token_service.deny_access_tokens(user_id)
+
+    async def resend_activation_email(self, email: str, cooldown_minutes: int = 2) -> tuple[UserRead, str]:
+        """Issue a new activation token for a user who hasn't activated their account yet.
 
         Args:
             email: User's email address
             cooldown_minutes: Minimum minutes between resend requests
 
         Returns:
-            UserRead: User information
+            tuple[UserRead, str]: User information and the raw verification token to email
 
         Raises:
             UserNotFoundError: If user doesn't exist
             UserAlreadyActivatedError: If user is already activated
             RateLimitExceededError: If resend is requested too soon after the last attempt
         """
-        from datetime import UTC, datetime, timedelta
+        from datetime import timedelta
 
         user = await self.user_repo.get_by_email(email)
         if user is None or user.id is None:
@@ -171,16 +173,7 @@ class UserService:
         if user.is_active:
             raise UserAlreadyActivatedError("User is already activated")
 
-        # Check rate limit using the latest verification token creation time
-        latest_token = await self.verification_token_service.repo.get_latest_for_user(user.id)
-        if latest_token is not None:
-            time_since_last_token = datetime.now(UTC) - latest_token.time_create
-            cooldown = timedelta(minutes=cooldown_minutes, seconds=0.1)
-            if time_since_last_token.total_seconds() <= (cooldown.total_seconds()):
-                remaining = cooldown - time_since_last_token
-                remaining_seconds = max(0, int(remaining.total_seconds()))
-                raise RateLimitExceededError(
-                    f"Please wait {remaining_seconds} seconds before requesting another activation email"
-                )
+        # The cooldown is checked by the statement that replaces the token, so a throttled request writes nothing
+        raw_token = await self.verification_token_service.issue(user.id, cooldown=timedelta(minutes=cooldown_minutes))
 
-        return UserRead.model_validate(user, from_attributes=True)
+        return UserRead.model_validate(user, from_attributes=True), raw_token
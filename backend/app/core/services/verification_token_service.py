@@ -7,7 +7,7 @@ from datetime import UTC, datetime, timedelta
 
 from app import SECRET_KEY, VERIFICATION_TOKEN_EXPIRE_MINUTES
 from app.core.domain import VerificationToken
-from app.core.exceptions import TokenExpireError, TokenInvalidError
+from app.core.exceptions import RateLimitExceededError, TokenExpireError, TokenInvalidError
 from app.core.repositories import IVerificationTokenRepository
 
 
@@ -23,18 +23,28 @@ class VerificationTokenService:
     def _hash(self, raw: str) -> str:
         return hmac.new(SECRET_KEY.encode(), raw.encode(), hashlib.sha256).hexdigest()
 
-    async def issue(self, user_id: int, expires_at: datetime | None = None) -> str:
+    async def issue(self, user_id: int, expires_at: datetime | None = None, cooldown: timedelta | None = None) -> str:
         """Issue a new single-use verification token for a user.
 
-        Deletes existing tokens for that user to prevent multiple valid tokens.
+        Replaces the user's existing token, so only one is ever valid.
         Returns the raw token value for emailing.
+
+        Raises RateLimitExceededError if ``cooldown`` is given and the existing token is younger
+        than it; the existing token is then kept and nothing is written.
         """
-        await self.repo.delete_all_for_user(user_id)
         raw = secrets.token_urlsafe(32)
         expires_at = expires_at or (datetime.now(UTC) + timedelta(minutes=self.default_expire_minutes))
         token_hash = self._hash(raw)
         domain_obj = VerificationToken(user_id=user_id, token_hash=token_hash, expires_at=expires_at)
-        await self.repo.create(domain_obj)
+        now = datetime.now(UTC)
+        cooldown = cooldown + timedelta(seconds=0.1) if cooldown is not None else None
+        replace_before = now - cooldown if cooldown is not None else None
+        kept_time_create = await self.repo.replace_for_user(domain_obj, replace_before=replace_before)
+        if cooldown is not None and kept_time_create is not None:
+            remaining_seconds = max(0, int((cooldown - (now - kept_time_create)).total_seconds()))
+            raise RateLimitExceededError(
+                f"Please wait {remaining_seconds} seconds before requesting another activation email"
+            )
         return raw
 
     async def validate_and_consume(self, raw_token: str) -> int:
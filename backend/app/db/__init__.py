@@ -1,7 +1,11 @@
 from . import models as models
 from .config import (
+    ReadSession as ReadSession,
     Session as Session,
     create_db_tables as create_db_tables,
     engine as engine,
+    read_engine as read_engine,
+    replica_engine as replica_engine,
     url_object as url_object,
+    warm_up_engine as warm_up_engine,
 )
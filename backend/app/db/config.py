@@ -1,6 +1,9 @@
 from __future__ import annotations
 
-from sqlalchemy import URL
+import os
+from typing import Any
+
+from sqlalchemy import URL, NullPool, text
 from sqlalchemy.ext.asyncio import AsyncEngine, async_sessionmaker, create_async_engine
 
 from app import env
@@ -15,10 +18,84 @@ url_object = URL.create(
     env.str("POSTGRES_DB"),
 )
 
-engine = create_async_engine(url_object, echo=env.bool("PRINT_SQL_QUERIES", False))
+# "lambda" keeps one warm connection per container; "null" leaves pooling to RDS Proxy/PgBouncer
+POOL_PRESETS: dict[str, dict[str, Any]] = {
+    "server": {"pool_size": 10, "max_overflow": 10, "pool_timeout": 30, "pool_recycle": 1800, "pool_pre_ping": True},
+    "lambda": {"pool_size": 1, "max_overflow": 1, "pool_timeout": 10, "pool_recycle": 300, "pool_pre_ping": True},
+    "null": {"poolclass": NullPool},
+}
+
+
+def get_engine_options(
+    preset: str,
+    pool_size: int | None = None,
+    max_overflow: int | None = None,
+    pool_timeout: float | None = None,
+    pool_recycle: int | None = None,
+    pool_pre_ping: bool | None = None,
+    statement_cache_size: int | None = None,
+) -> dict[str, Any]:
+    """Build ``create_async_engine`` pool options from a preset and explicit overrides."""
+    try:
+        options = dict(POOL_PRESETS[preset])
+    except KeyError:
+        msg = f"Unknown database pool preset {preset!r}, expected one of {', '.join(POOL_PRESETS)}"
+        raise ValueError(msg) from None
+    if options.get("poolclass") is not NullPool:
+        overrides = {
+            "pool_size": pool_size,
+            "max_overflow": max_overflow,
+            "pool_timeout": pool_timeout,
+            "pool_recycle": pool_recycle,
+        }
+        options.update({key: value for key, value in overrides.items() if value is not None})
+    if pool_pre_ping is not None:
+        options["pool_pre_ping"] = pool_pre_ping
+    # Transaction-mode poolers can't keep asyncpg's per-connection prepared statements
+    if statement_cache_size is not None:
+        options["connect_args"] = {"statement_cache_size": statement_cache_size}
+    return options
+
+
+engine_options = get_engine_options(
+    env.str("DB_POOL_PRESET", "lambda" if "AWS_LAMBDA_FUNCTION_NAME" in os.environ else "server"),
+    pool_size=env.int("DB_POOL_SIZE", None),
+    max_overflow=env.int("DB_MAX_OVERFLOW", None),
+    pool_timeout=env.float("DB_POOL_TIMEOUT", None),
+    pool_recycle=env.int("DB_POOL_RECYCLE", None),
+    pool_pre_ping=env.bool("DB_POOL_PRE_PING", None),
+    statement_cache_size=env.int("DB_STATEMENT_CACHE_SIZE", None),
+)
+engine = create_async_engine(url_object, echo=env.bool("PRINT_SQL_QUERIES", False), **engine_options)
 Session = async_sessionmaker(engine, expire_on_commit=False)
 
 
+def get_replica_url(host: str | None, port: int | None = None) -> URL | None:
+    """URL of a read replica that shares the primary's credentials and database name."""
+    if not host:
+        return None
+    return url_object.set(host=host, port=port or url_object.port)
+
+
+replica_url = get_replica_url(env.str("POSTGRES_REPLICA_HOST", None), env.int("POSTGRES_REPLICA_PORT", None))
+replica_engine = (
+    create_async_engine(replica_url, echo=env.bool("PRINT_SQL_QUERIES", False), **engine_options)
+    if replica_url is not None
+    else None
+)
+
+# Read-only requests run on the replica when one is configured, otherwise on the primary's
+# pool. Statements run outside of a transaction, so no BEGIN or COMMIT round trips are sent
+read_engine = (replica_engine or engine).execution_options(isolation_level="AUTOCOMMIT")
+ReadSession = async_sessionmaker(read_engine, expire_on_commit=False)
+
+
 async def create_db_tables(engine: AsyncEngine = engine):
     async with engine.begin() as conn:
         await conn.run_sync(Base.metadata.create_all)
+
+
+async def warm_up_engine(engine: AsyncEngine = engine) -> None:
+    """Open a pooled connection ahead of the first request."""
+    async with engine.connect() as conn:
+        await conn.execute(text("SELECT 1"))
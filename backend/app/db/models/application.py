@@ -2,7 +2,7 @@ from __future__ import annotations
 
 from datetime import datetime
 
-from sqlalchemy import DateTime, ForeignKey, String
+from sqlalchemy import DateTime, ForeignKey, Index, String, func
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.core.domain import AppStatus, WorkLocation, WorkType
@@ -37,3 +37,39 @@ class Company(Base):
     id: Mapped[pk_tp]
     name: Mapped[str] = mapped_column(String(40), unique=True)
     applications: Mapped[list["Application"]] = relationship(back_populates="company")
+
+
+# Serve the per-user listing (ORDER BY <column>, id) as an index range scan in either direction
+Index(
+    "ix_application_user_id_time_create",
+    Application.user_id,
+    Application.time_create.desc(),
+    Application.id.desc(),
+)
+Index(
+    "ix_application_user_id_time_update",
+    Application.user_id,
+    Application.time_update.desc(),
+    Application.id.desc(),
+)
+
+# Substring (ILIKE '%...%') and fuzzy matching on names can't use B-tree indexes
+Index(
+    "ix_application_role_trgm",
+    Application.role,
+    postgresql_using="gin",
+    postgresql_ops={"role": "gin_trgm_ops"},
+)
+Index(
+    "ix_company_name_trgm",
+    Company.name,
+    postgresql_using="gin",
+    postgresql_ops={"name": "gin_trgm_ops"},
+)
+
+# Case-insensitive prefix lookups for autocomplete; pattern ops compare byte-wise, like LIKE 'abc%'
+Index(
+    "ix_company_name_lower_pattern",
+    func.lower(Company.name).label("name_lower"),
+    postgresql_ops={"name_lower": "text_pattern_ops"},
+)
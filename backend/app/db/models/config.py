@@ -2,7 +2,7 @@ import datetime
 import enum
 from typing import Annotated
 
-from sqlalchemy import DateTime, Enum, func
+from sqlalchemy import DDL, DateTime, Enum, event, func
 from sqlalchemy.ext.asyncio import AsyncAttrs
 from sqlalchemy.orm import DeclarativeBase, mapped_column
 
@@ -35,3 +35,7 @@ class Base(AsyncAttrs, DeclarativeBase):
             if col in self.repr_additional_cols or inx < self.repr_num_cols:
                 cols.append(f"{col}={getattr(self, col)}")
         return f"<{self.__class__.__name__} {', '.join(cols)}>"
+
+
+# Trigram GIN indexes rely on pg_trgm; metadata.create_all() has to enable it just like the migrations do
+event.listen(Base.metadata, "before_create", DDL("CREATE EXTENSION IF NOT EXISTS pg_trgm"))
@@ -2,7 +2,7 @@ from __future__ import annotations
 
 from datetime import datetime
 
-from sqlalchemy import DateTime, ForeignKey, String, func
+from sqlalchemy import DateTime, ForeignKey, Index, String, func
 from sqlalchemy.orm import Mapped, mapped_column
 
 from .config import Base, pk_tp
@@ -12,9 +12,9 @@ class RefreshToken(Base):
     __tablename__ = "refresh_token"
 
     id: Mapped[pk_tp]
-    user_id: Mapped[int] = mapped_column(ForeignKey("user.id", ondelete="CASCADE"), index=True)
+    user_id: Mapped[int] = mapped_column(ForeignKey("user.id", ondelete="CASCADE"))
     token_hash: Mapped[str] = mapped_column(String(128), unique=True, index=True)
-    family_id: Mapped[str] = mapped_column(String(64), index=True)
+    family_id: Mapped[str] = mapped_column(String(64))
     parent_token_id: Mapped[int | None] = mapped_column(
         ForeignKey("refresh_token.id", ondelete="SET NULL"), nullable=True, index=True
     )
@@ -26,3 +26,19 @@ class RefreshToken(Base):
     time_update: Mapped[datetime] = mapped_column(
         DateTime(timezone=True), server_default=func.current_timestamp(), server_onupdate=func.current_timestamp()
     )
+
+
+# Serves the per-user live-token lookups (revoked_at IS NULL AND expires_at > now) behind session listing and
+# the session cap; it also covers plain user_id lookups, so there is no separate user_id index
+Index(
+    "ix_refresh_token_user_id_revoked_at_expires_at",
+    RefreshToken.user_id,
+    RefreshToken.revoked_at,
+    RefreshToken.expires_at,
+)
+# Families are only looked up to revoke their live tokens, so revoked rows are left out of the index
+Index(
+    "ix_refresh_token_family_id_live",
+    RefreshToken.family_id,
+    postgresql_where=RefreshToken.revoked_at.is_(None),
+)
@@ -12,7 +12,8 @@ class VerificationToken(Base):
     __tablename__ = "verification_token"
 
     id: Mapped[pk_tp]
-    user_id: Mapped[int] = mapped_column(ForeignKey("user.id", ondelete="CASCADE"), index=True)
+    # A user has at most one verification token; issuing a new one replaces it in place
+    user_id: Mapped[int] = mapped_column(ForeignKey("user.id", ondelete="CASCADE"), unique=True, index=True)
     token_hash: Mapped[str] = mapped_column(String(128), unique=True, index=True)
     # Store timezone-aware datetimes to avoid mixing naive/aware values
     expires_at: Mapped[datetime] = mapped_column(DateTime(timezone=True))
@@ -7,7 +7,7 @@ from fastapi import Cookie, Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordBearer
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app import DEBUG
+from app import DEBUG, STATELESS_AUTH
 from app.core.dto import AccessTokenPayload, UserRead
 from app.core.exceptions import (
     TokenExpireError,
@@ -34,9 +34,11 @@ from app.infrastructure.repositories import (
 from app.infrastructure.security import (
     AccessTokenStrategy,
     PwdlibHasher,
+    TransactionalAccessTokenDenyList,
+    access_token_deny_list,
 )
 
-from .db import Session as SessionMaker
+from .db import ReadSession as ReadSessionMaker, Session as SessionMaker
 
 
 async def get_session() -> AsyncGenerator[AsyncSession]:
@@ -45,12 +47,28 @@ async def get_session() -> AsyncGenerator[AsyncSession]:
         await session.commit()
 
 
+async def get_read_session() -> AsyncGenerator[AsyncSession]:
+    """Autocommit session for handlers that only read, so no COMMIT is sent after them."""
+    async with ReadSessionMaker() as session:
+        yield session
+
+
 async def get_verification_token_service(session: SessionDep) -> VerificationTokenService:
     return VerificationTokenService(repo=VerificationTokenSQLAlchemyRepository(session))
 
 
 async def get_refresh_token_service(session: SessionDep) -> RefreshTokenService:
-    return RefreshTokenService(repo=RefreshTokenSQLAlchemyRepository(session))
+    return RefreshTokenService(
+        repo=RefreshTokenSQLAlchemyRepository(session),
+        access_token_deny_list=TransactionalAccessTokenDenyList(session, access_token_deny_list),
+    )
+
+
+async def get_read_refresh_token_service(session: ReadSessionDep) -> RefreshTokenService:
+    return RefreshTokenService(
+        repo=RefreshTokenSQLAlchemyRepository(session),
+        access_token_deny_list=access_token_deny_list,
+    )
 
 
 async def get_user_service(
@@ -67,6 +85,19 @@ async def get_user_service(
     )
 
 
+async def get_read_user_service(session: ReadSessionDep) -> UserService:
+    return UserService(
+        user_repo=UserSQLAlchemyRepository(session),
+        password_hasher=PwdlibHasher(),
+        verification_token_service=VerificationTokenService(repo=VerificationTokenSQLAlchemyRepository(session)),
+        access_token_strategy=AccessTokenStrategy(),
+        refresh_token_service=RefreshTokenService(
+            repo=RefreshTokenSQLAlchemyRepository(session),
+            access_token_deny_list=access_token_deny_list,
+        ),
+    )
+
+
 async def get_auth_service(session: SessionDep, refresh_token_service: RefreshTokenServiceDep) -> AuthService:
     return AuthService(
         user_repo=UserSQLAlchemyRepository(session),
@@ -84,6 +115,14 @@ async def get_application_service(session: SessionDep) -> ApplicationService:
     )
 
 
+async def get_read_application_service(session: ReadSessionDep) -> ApplicationService:
+    return ApplicationService(
+        app_repo=ApplicationSQLAlchemyRepository(session),
+        user_repo=UserSQLAlchemyRepository(session),
+        company_repo=CompanySQLAlchemyRepository(session),
+    )
+
+
 async def get_user_email_service(
     session: SessionDep, verification_token_service: VerificationTokenServiceDep
 ) -> UserEmailService:
@@ -99,6 +138,12 @@ async def get_company_service(session: SessionDep) -> CompanyService:
     )
 
 
+async def get_read_company_service(session: ReadSessionDep) -> CompanyService:
+    return CompanyService(
+        company_repo=CompanySQLAlchemyRepository(session),
+    )
+
+
 async def get_user(user_service: UserServiceDep, payload: AccessTokenPayloadDep) -> UserRead:
     try:
         user = await user_service.get_by_email(email=payload.user_email)
@@ -116,6 +161,36 @@ async def get_active_user(user: UserDep) -> UserRead:
     return user
 
 
+async def check_active_user_claims(
+    user_service: UserService, payload: AccessTokenPayload, trust_claims: bool = False
+) -> AccessTokenPayload:
+    """Authenticate from the access-token claims, loading the user only when they can't be trusted."""
+    if trust_claims and STATELESS_AUTH and payload.is_active is not None:
+        if access_token_deny_list.is_denied(payload):
+            raise HTTPException(
+                status.HTTP_401_UNAUTHORIZED, "Token has been revoked", headers={"WWW-Authenticate": "Bearer"}
+            )
+        is_active = payload.is_active
+    else:
+        user = await get_user(user_service, payload)
+        is_active = user.is_active
+    if not is_active:
+        raise HTTPException(status.HTTP_403_FORBIDDEN, "User account is not activated")
+    return payload
+
+
+async def get_active_user_claims(user_service: UserServiceDep, payload: AccessTokenPayloadDep) -> AccessTokenPayload:
+    # Writes always check the user in the database: the deny-list is per process, so a deactivation
+    # or deletion handled by another process (or Lambda container) would not be seen here
+    return await check_active_user_claims(user_service, payload)
+
+
+async def get_read_active_user_claims(
+    user_service: ReadUserServiceDep, payload: AccessTokenPayloadDep
+) -> AccessTokenPayload:
+    return await check_active_user_claims(user_service, payload, trust_claims=True)
+
+
 def get_refresh_token(refresh: Annotated[str, Cookie()]) -> str:
     return refresh
 
@@ -143,12 +218,19 @@ RefreshTokenDep = Annotated[str, Depends(get_refresh_token)]
 AccessTokenDep = Annotated[str, Depends(get_access_token)]
 AccessTokenPayloadDep = Annotated[AccessTokenPayload, Depends(get_access_token_payload)]
 SessionDep = Annotated[AsyncSession, Depends(get_session)]
+ReadSessionDep = Annotated[AsyncSession, Depends(get_read_session)]
 VerificationTokenServiceDep = Annotated[VerificationTokenService, Depends(get_verification_token_service)]
 RefreshTokenServiceDep = Annotated[RefreshTokenService, Depends(get_refresh_token_service)]
+ReadRefreshTokenServiceDep = Annotated[RefreshTokenService, Depends(get_read_refresh_token_service)]
 UserServiceDep = Annotated[UserService, Depends(get_user_service)]
+ReadUserServiceDep = Annotated[UserService, Depends(get_read_user_service)]
 AuthServiceDep = Annotated[AuthService, Depends(get_auth_service)]
 ApplicationServiceDep = Annotated[ApplicationService, Depends(get_application_service)]
+ReadApplicationServiceDep = Annotated[ApplicationService, Depends(get_read_application_service)]
 CompanyServiceDep = Annotated[CompanyService, Depends(get_company_service)]
+ReadCompanyServiceDep = Annotated[CompanyService, Depends(get_read_company_service)]
 UserEmailServiceDep = Annotated[UserEmailService, Depends(get_user_email_service)]
 UserDep = Annotated[UserRead, Depends(get_user)]
 ActiveUserDep = Annotated[UserRead, Depends(get_active_user)]
+ActiveUserClaimsDep = Annotated[AccessTokenPayload, Depends(get_active_user_claims)]
+ReadActiveUserClaimsDep = Annotated[AccessTokenPayload, Depends(get_read_active_user_claims)]
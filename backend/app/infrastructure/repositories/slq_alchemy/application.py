@@ -1,11 +1,32 @@
 from __future__ import annotations
 
-from sqlalchemy import asc, delete, desc, func, or_, select, update
+from collections.abc import AsyncIterator
+from typing import cast
 
-from app.core.domain import Application
+from sqlalchemy import (
+    BindParameter,
+    Integer,
+    any_,
+    asc,
+    bindparam,
+    delete,
+    desc,
+    func,
+    insert,
+    literal_column,
+    or_,
+    select,
+    tuple_,
+    update,
+)
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.orm import contains_eager
+from sqlalchemy.types import TypeEngine
+
+from app.core.domain import Application, ApplicationCounts, ApplicationWithCompany
 from app.core.dto import ApplicationFilterParams
 from app.core.repositories import IApplicationRepository
-from app.db.models import Application as ApplicationModel, Company, User
+from app.db.models import Application as ApplicationModel, Company
 
 from .config import SQLAlchemyRepository
 
@@ -13,14 +34,17 @@ from .config import SQLAlchemyRepository
 class ApplicationSQLAlchemyRepository(SQLAlchemyRepository[ApplicationModel], IApplicationRepository):
     model = ApplicationModel
 
-    def _build_filtered_statement(self, email: str, filter_param: ApplicationFilterParams):
-        statement = select(self.model).join(User).where(User.email == email)
+    def _build_filtered_statement(
+        self, user_id: int, filter_param: ApplicationFilterParams, with_company: bool = False
+    ):
+        statement = select(self.model).where(self.model.user_id == user_id)
+        if with_company or filter_param.company_name:
+            statement = statement.join(Company)
         if filter_param.role_name:
             statement = statement.where(self.model.role.icontains(filter_param.role_name))
 
         or_statements = []
         if filter_param.company_name:
-            statement = statement.join(Company)
             or_statements.append(Company.name.icontains(filter_param.company_name))
         if filter_param.status:
             or_statements.append(self.model.status.in_(filter_param.status))
@@ -38,34 +62,159 @@ class ApplicationSQLAlchemyRepository(SQLAlchemyRepository[ApplicationModel], IA
         await self.session.flush()
         return Application.model_validate(app_model, from_attributes=True)
 
-    async def get_by_user_email(self, email: str, filter_param: ApplicationFilterParams) -> list[Application]:
+    async def create_many(self, applications: list[Application]) -> int:
+        if not applications:
+            return 0
+        # A list of parameter sets runs as one batched executemany INSERT instead of a flush per object
+        rows = [app.model_dump(exclude={"id", "time_create", "time_update"}) for app in applications]
+        await self.session.execute(insert(self.model), rows)
+        return len(rows)
+
+    async def get_by_user_id(
+        self, user_id: int, filter_param: ApplicationFilterParams, limit: int | None = None
+    ) -> list[ApplicationWithCompany]:
         order_by_clause = getattr(self.model, filter_param.order_by)
         order_direction = asc if filter_param.order_direction == "asc" else desc
 
-        statement = self._build_filtered_statement(email, filter_param)
+        # Populate the company relationship from the same JOIN instead of a follow-up query
+        statement = self._build_filtered_statement(user_id, filter_param, with_company=True).options(
+            contains_eager(self.model.company)
+        )
 
-        statement = (
-            statement.limit(filter_param.limit).offset(filter_param.offset).order_by(order_direction(order_by_clause))
+        cursor = filter_param.page_cursor
+        if cursor is None:
+            statement = statement.offset(filter_param.offset)
+        else:
+            # Keyset pagination: seek past the last seen (order_by, id) pair instead of skipping rows
+            position = tuple_(order_by_clause, self.model.id)
+            after = (cursor.value, cursor.id)
+            statement = statement.where(position > after if filter_param.order_direction == "asc" else position < after)
+
+        statement = statement.limit(limit or filter_param.limit).order_by(
+            order_direction(order_by_clause), order_direction(self.model.id)
         )
         apps = await self.session.scalars(statement)
-        return [Application.model_validate(app, from_attributes=True) for app in apps]
+        return [ApplicationWithCompany.model_validate(app, from_attributes=True) for app in apps]
 
-    async def count_by_user_email(self, email: str, filter_param: ApplicationFilterParams) -> int:
-        statement = self._build_filtered_statement(email, filter_param)
+    async def count_by_user_id(self, user_id: int, filter_param: ApplicationFilterParams) -> int:
+        statement = self._build_filtered_statement(user_id, filter_param)
         count_statement = select(func.count()).select_from(statement.subquery())
         total = await self.session.scalar(count_statement)
         return total or 0
 
-    async def get_by_id(self, application_id: int) -> Application | None:
+    async def stream_by_user_id(self, user_id: int, batch_size: int = 500) -> AsyncIterator[ApplicationWithCompany]:
+        # Server-side cursor fetching `batch_size` rows at a time; needs an open transaction on asyncpg
+        statement = (
+            select(self.model)
+            .join(Company)
+            .where(self.model.user_id == user_id)
+            .options(contains_eager(self.model.company))
+            .order_by(self.model.time_create, self.model.id)
+            .execution_options(yield_per=batch_size)
+        )
+        result = await self.session.stream_scalars(statement)
+        try:
+            async for app in result:
+                yield ApplicationWithCompany.model_validate(app, from_attributes=True)
+        finally:
+            await result.close()
+
+    async def get_counts(self, user_id: int) -> ApplicationCounts:
+        # Weeks are cut in UTC whatever the server's TimeZone. The literals are inlined because bound
+        # parameters would be numbered differently in SELECT and GROUP BY, which Postgres rejects
+        week = func.date_trunc(literal_column("'week'"), func.timezone(literal_column("'UTC'"), self.model.time_create))
+        grouped = (self.model.status, self.model.work_type, self.model.work_location, week)
+        # One pass over the user's rows; every grouping set leaves the other (NOT NULL) columns null
+        statement = (
+            select(*grouped, func.count())
+            .where(self.model.user_id == user_id)
+            .group_by(func.grouping_sets(*(tuple_(column) for column in grouped)))
+        )
+        counts = ApplicationCounts(by_status={}, by_work_type={}, by_work_location={}, by_week={})
+        for status, work_type, work_location, week_start, count in await self.session.execute(statement):
+            if status is not None:
+                counts.by_status[status] = count
+            elif work_type is not None:
+                counts.by_work_type[work_type] = count
+            elif work_location is not None:
+                counts.by_work_location[work_location] = count
+            else:
+                counts.by_week[week_start] = count
+        return counts
+
+    async def search(self, user_id: int, query: str, limit: int) -> list[ApplicationWithCompany]:
+        # `%>` (word similarity) tolerates typos and ILIKE catches queries too short for trigrams;
+        # both are served by the pg_trgm GIN indexes on application.role and company.name
+        rank = func.greatest(func.word_similarity(query, self.model.role), func.word_similarity(query, Company.name))
+        statement = (
+            select(self.model)
+            .join(Company)
+            .where(
+                self.model.user_id == user_id,
+                or_(
+                    self.model.role.op("%>")(query),
+                    Company.name.op("%>")(query),
+                    self.model.role.icontains(query, autoescape=True),
+                    Company.name.icontains(query, autoescape=True),
+                ),
+            )
+            .options(contains_eager(self.model.company))
+            .order_by(rank.desc(), self.model.id.desc())
+            .limit(limit)
+        )
+        apps = await self.session.scalars(statement)
+        return [ApplicationWithCompany.model_validate(app, from_attributes=True) for app in apps]
+
+    async def get_by_id(self, application_id: int, user_id: int | None = None) -> Application | None:
         statement = select(self.model).where(self.model.id == application_id)
+        if user_id is not None:
+            statement = statement.where(self.model.user_id == user_id)
         app = await self.session.scalar(statement)
         return Application.model_validate(app, from_attributes=True) if app else None
 
-    async def update(self, application_id: int, **update_data) -> Application:
-        statement = update(self.model).where(self.model.id == application_id).values(update_data).returning(self.model)
+    async def get_owner_id(self, application_id: int) -> int | None:
+        statement = select(self.model.user_id).where(self.model.id == application_id)
+        return await self.session.scalar(statement)
+
+    async def update(self, application_id: int, user_id: int, **update_data) -> Application | None:
+        statement = (
+            update(self.model)
+            .where(self.model.id == application_id, self.model.user_id == user_id)
+            .values(update_data)
+            .returning(self.model)
+        )
         updated_app = await self.session.scalar(statement)
-        return Application.model_validate(updated_app, from_attributes=True)
+        return Application.model_validate(updated_app, from_attributes=True) if updated_app else None
+
+    async def update_many(self, user_id: int, application_ids: list[int], **update_data) -> list[Application]:
+        statement = (
+            update(self.model)
+            .where(self.model.id == any_(self._ids_param(application_ids)), self.model.user_id == user_id)
+            .values(update_data)
+            .returning(self.model)
+        )
+        apps = await self.session.scalars(statement)
+        return [Application.model_validate(app, from_attributes=True) for app in apps]
+
+    async def delete(self, application_id: int, user_id: int) -> bool:
+        statement = (
+            delete(self.model)
+            .where(self.model.id == application_id, self.model.user_id == user_id)
+            .returning(self.model.id)
+        )
+        return await self.session.scalar(statement) is not None
 
-    async def delete(self, application_id: int) -> None:
-        statement = delete(self.model).where(self.model.id == application_id)
-        await self.session.execute(statement)
+    async def delete_many(self, user_id: int, application_ids: list[int]) -> list[int]:
+        statement = (
+            delete(self.model)
+            .where(self.model.id == any_(self._ids_param(application_ids)), self.model.user_id == user_id)
+            .returning(self.model.id)
+        )
+        return list(await self.session.scalars(statement))
+
+    @staticmethod
+    def _ids_param(application_ids: list[int]) -> BindParameter[list[int]]:
+        # A single array parameter keeps one prepared statement for any number of ids, unlike an expanding IN
+        return bindparam(
+            "application_ids", application_ids, type_=cast(TypeEngine[list[int]], postgresql.ARRAY(Integer))
+        )
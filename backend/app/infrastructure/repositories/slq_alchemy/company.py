@@ -2,16 +2,77 @@ from __future__ import annotations
 
 from typing import Iterable
 
-from sqlalchemy import asc, desc, select
+from sqlalchemy import asc, bindparam, desc, event, func, select
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.orm import Session
 
+from app import COMPANY_AUTOCOMPLETE_CACHE_TTL_SECONDS, COMPANY_CACHE_MAX_SIZE, COMPANY_CACHE_TTL_SECONDS
 from app.core.domain import Company
 from app.core.dto import CompanyFilterParams
 from app.core.repositories import ICompanyRepository
 from app.db.models import Company as CompanyModel
+from app.utils.cache import CacheStats, TTLCache
 
 from .config import SQLAlchemyRepository
 
 
+class CompanyCache:
+    """Companies keyed by name and by id.
+
+    Company rows are never updated or deleted by the application, so entries can't go stale;
+    the TTL only bounds how long a manual database change can go unnoticed. The cache lives in
+    process memory, which on Lambda means one copy per warm execution environment.
+    """
+
+    def __init__(self, max_size: int, ttl_seconds: float) -> None:
+        self.by_name: TTLCache[str, Company] = TTLCache(max_size, ttl_seconds)
+        self.by_id: TTLCache[int, Company] = TTLCache(max_size, ttl_seconds)
+
+    def get_by_name(self, name: str) -> Company | None:
+        company = self.by_name.get(name)
+        return company.model_copy() if company else None
+
+    def get_by_id(self, company_id: int) -> Company | None:
+        company = self.by_id.get(company_id)
+        return company.model_copy() if company else None
+
+    def set(self, company: Company) -> None:
+        if company.id is None:
+            return
+        self.by_name.set(company.name, company.model_copy())
+        self.by_id.set(company.id, company.model_copy())
+
+    def clear(self) -> None:
+        self.by_name.clear()
+        self.by_id.clear()
+
+    def stats(self) -> dict[str, CacheStats]:
+        return {"by_name": self.by_name.stats(), "by_id": self.by_id.stats()}
+
+
+company_cache = CompanyCache(COMPANY_CACHE_MAX_SIZE, COMPANY_CACHE_TTL_SECONDS)
+# Suggestions per (lowercased prefix, limit); short, popular prefixes stay hot in the LRU
+company_autocomplete_cache: TTLCache[tuple[str, int], list[Company]] = TTLCache(
+    1024, COMPANY_AUTOCOMPLETE_CACHE_TTL_SECONDS
+)
+
+# Companies resolved through an INSERT by the session's current transaction, keyed by name
+_PENDING_COMPANIES = "pending_companies"
+
+
+@event.listens_for(Session, "after_commit")
+def _cache_committed_companies(session: Session) -> None:
+    for company in session.info.pop(_PENDING_COMPANIES, {}).values():
+        company_cache.set(company)
+
+
+@event.listens_for(Session, "after_soft_rollback")
+def _discard_pending_companies(session: Session, previous_transaction) -> None:
+    # A cached id of a rolled back insert would break the foreign keys of later applications.
+    # Savepoint rollbacks discard everything too; that only costs a few cache fills.
+    session.info.pop(_PENDING_COMPANIES, None)
+
+
 class CompanySQLAlchemyRepository(SQLAlchemyRepository[CompanyModel], ICompanyRepository):
     model = CompanyModel
 
@@ -19,22 +80,76 @@ class CompanySQLAlchemyRepository(SQLAlchemyRepository[CompanyModel], ICompanyRe
         company_model = self.model(**company.model_dump())
         self.session.add(company_model)
         await self.session.flush()
-        return Company.model_validate(company_model, from_attributes=True)
+        return self._cache_after_commit(Company.model_validate(company_model, from_attributes=True))
 
     async def get_by_name(self, name: str) -> Company | None:
+        if cached := company_cache.get_by_name(name):
+            return cached
         statement = select(self.model).where(self.model.name == name)
         company_model = await self.session.scalar(statement)
-        return Company.model_validate(company_model, from_attributes=True) if company_model else None
+        return self._cache(Company.model_validate(company_model, from_attributes=True)) if company_model else None
+
+    async def get_or_create(self, name: str) -> Company:
+        if cached := company_cache.get_by_name(name):
+            return cached
+        # The no-op DO UPDATE makes RETURNING yield the existing row too, in one race-free round trip
+        insert_statement = insert(self.model).values(name=name)
+        statement = insert_statement.on_conflict_do_update(
+            index_elements=[self.model.name], set_={"name": insert_statement.excluded.name}
+        ).returning(self.model)
+        company_model = await self.session.scalar(statement)
+        return self._cache_after_commit(Company.model_validate(company_model, from_attributes=True))
+
+    async def get_or_create_many(self, names: Iterable[str]) -> dict[str, int]:
+        company_ids: dict[str, int] = {}
+        uncached: set[str] = set()
+        for name in set(names):
+            if cached := company_cache.get_by_name(name):
+                company_ids[name] = cached.id  # type: ignore[assignment]
+            else:
+                uncached.add(name)
+        if not uncached:
+            return company_ids
+        statement = select(self.model.name, self.model.id).where(self.model.name.in_(uncached))
+        resolved: dict[str, int] = {name: company_id for name, company_id in await self.session.execute(statement)}
+        missing = uncached - resolved.keys()
+        if missing:
+            insert_statement = (
+                insert(self.model)
+                # Sorted so concurrent imports take the unique-index locks in the same order
+                .values([{"name": name} for name in sorted(missing)])
+                .on_conflict_do_nothing(index_elements=[self.model.name])
+                .returning(self.model.name, self.model.id)
+            )
+            resolved.update({name: company_id for name, company_id in await self.session.execute(insert_statement)})
+            # Names inserted by a concurrent transaction are skipped by DO NOTHING and not returned
+            if raced := missing - resolved.keys():
+                statement = select(self.model.name, self.model.id).where(self.model.name.in_(raced))
+                resolved.update({name: company_id for name, company_id in await self.session.execute(statement)})
+        for name, company_id in resolved.items():
+            self._cache_after_commit(Company(id=company_id, name=name))
+        return company_ids | resolved
 
     async def get_by_id(self, company_id: int) -> Company | None:
+        if cached := company_cache.get_by_id(company_id):
+            return cached
         statement = select(self.model).where(self.model.id == company_id)
         company_model = await self.session.scalar(statement)
-        return Company.model_validate(company_model, from_attributes=True) if company_model else None
+        return self._cache(Company.model_validate(company_model, from_attributes=True)) if company_model else None
 
     async def get_by_ids(self, company_ids: Iterable[int]) -> list[Company]:
-        statement = select(self.model).where(self.model.id.in_(company_ids))
-        company_model = await self.session.scalars(statement)
-        return [Company.model_validate(c, from_attributes=True) for c in company_model]
+        companies: list[Company] = []
+        uncached: set[int] = set()
+        for company_id in set(company_ids):
+            if cached := company_cache.get_by_id(company_id):
+                companies.append(cached)
+            else:
+                uncached.add(company_id)
+        if uncached:
+            statement = select(self.model).where(self.model.id.in_(uncached))
+            company_model = await self.session.scalars(statement)
+            companies.extend(self._cache(Company.model_validate(c, from_attributes=True)) for c in company_model)
+        return companies
 
     async def get_companies(
         self,
@@ -60,3 +175,32 @@ class CompanySQLAlchemyRepository(SQLAlchemyRepository[CompanyModel], ICompanyRe
         )
         company_model = await self.session.scalars(statement)
         return [Company.model_validate(c, from_attributes=True) for c in company_model]
+
+    async def autocomplete(self, prefix: str, limit: int) -> list[Company]:
+        cache_key = (prefix.lower(), limit)
+        if (cached := company_autocomplete_cache.get(cache_key)) is not None:
+            return [company.model_copy() for company in cached]
+        escaped = prefix.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+        # Rendered inline so the pattern is a plan-time constant, which LIKE needs to use the
+        # lower(name) text_pattern_ops index; lowercasing in Postgres keeps it consistent with the index
+        pattern = func.lower(bindparam("prefix", escaped + "%", literal_execute=True))
+        statement = (
+            select(self.model)
+            .where(func.lower(self.model.name).like(pattern, escape="\\"))
+            .order_by(func.length(self.model.name), self.model.name)
+            .limit(limit)
+        )
+        company_model = await self.session.scalars(statement)
+        companies = [Company.model_validate(c, from_attributes=True) for c in company_model]
+        company_autocomplete_cache.set(cache_key, companies)
+        return [company.model_copy() for company in companies]
+
+    def _cache(self, company: Company) -> Company:
+        # Rows this transaction inserted only become visible to other sessions once it commits
+        if company.name not in self.session.info.get(_PENDING_COMPANIES, {}):
+            company_cache.set(company)
+        return company
+
+    def _cache_after_commit(self, company: Company) -> Company:
+        self.session.info.setdefault(_PENDING_COMPANIES, {})[company.name] = company
+        return company
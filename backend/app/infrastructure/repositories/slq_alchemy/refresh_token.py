@@ -1,8 +1,23 @@
 from __future__ import annotations
 
 from datetime import datetime, timezone
+from typing import Any, cast
 
-from sqlalchemy import select, update
+from sqlalchemy import (
+    ColumnClause,
+    ColumnElement,
+    CursorResult,
+    DateTime,
+    String,
+    and_,
+    delete,
+    insert,
+    literal,
+    literal_column,
+    or_,
+    select,
+    update,
+)
 
 from app.core.domain.refresh_token import RefreshToken as RefreshTokenDomain
 from app.core.repositories.refresh_token_repository import IRefreshTokenRepository
@@ -30,6 +45,15 @@ class RefreshTokenSQLAlchemyRepository(SQLAlchemyRepository[RefreshTokenModel],
         model = await self.session.scalar(statement)
         return RefreshTokenDomain.model_validate(model, from_attributes=True) if model else None
 
+    async def get_active_for_user(self, user_id: int) -> list[RefreshTokenDomain]:
+        statement = (
+            select(self.model)
+            .where(self._is_live(user_id, datetime.now(timezone.utc)), self.model.used_at.is_(None))
+            .order_by(self.model.id.desc())
+        )
+        models = await self.session.scalars(statement)
+        return [RefreshTokenDomain.model_validate(model, from_attributes=True) for model in models]
+
     async def mark_used(self, token_id: int) -> RefreshTokenDomain | None:
         statement = (
             update(self.model)
@@ -40,6 +64,38 @@ class RefreshTokenSQLAlchemyRepository(SQLAlchemyRepository[RefreshTokenModel],
         model = await self.session.scalar(statement)
         return RefreshTokenDomain.model_validate(model, from_attributes=True) if model else None
 
+    async def rotate(
+        self, token_hash: str, new_token_hash: str, expires_at: datetime, user_id: int | None = None
+    ) -> RefreshTokenDomain | None:
+        # UPDATE ... RETURNING in a CTE feeding INSERT ... SELECT: the conditional update takes the row lock,
+        # so of two concurrent rotations of the same token only one finds it unused and inserts a child
+        now = datetime.now(timezone.utc)
+        statement = update(self.model).where(
+            self.model.token_hash == token_hash,
+            self.model.used_at.is_(None),
+            self.model.revoked_at.is_(None),
+            self.model.expires_at > now,
+        )
+        if user_id is not None:
+            statement = statement.where(self.model.user_id == user_id)
+        used = (
+            statement.values(used_at=now).returning(self.model.id, self.model.user_id, self.model.family_id).cte("used")
+        )
+        child = select(
+            used.c.user_id,
+            literal(new_token_hash, String),
+            used.c.family_id,
+            used.c.id,
+            literal(expires_at, DateTime(timezone=True)),
+        )
+        insert_statement = (
+            insert(self.model)
+            .from_select(["user_id", "token_hash", "family_id", "parent_token_id", "expires_at"], child)
+            .returning(*self.model.__table__.c)
+        )
+        row = (await self.session.execute(insert_statement)).mappings().one_or_none()
+        return RefreshTokenDomain.model_validate(row) if row else None
+
     async def revoke(self, token_id: int) -> RefreshTokenDomain | None:
         statement = (
             update(self.model)
@@ -50,19 +106,56 @@ class RefreshTokenSQLAlchemyRepository(SQLAlchemyRepository[RefreshTokenModel],
         model = await self.session.scalar(statement)
         return RefreshTokenDomain.model_validate(model, from_attributes=True) if model else None
 
-    async def revoke_token_family(self, family_id: str) -> None:
-        """Revoke entire token family by family_id.
+    async def revoke_oldest_sessions(self, user_id: int, keep: int) -> int:
+        # Each session has exactly one unused live token; its id grows with every refresh,
+        # so ordering by id evicts the least recently refreshed sessions
+        now = datetime.now(timezone.utc)
+        evicted = (
+            select(self.model.id)
+            .where(self._is_live(user_id, now), self.model.used_at.is_(None))
+            .order_by(self.model.id.desc())
+            .offset(keep)
+        )
+        statement = update(self.model).where(self.model.id.in_(evicted)).values(revoked_at=now)
+        result = cast(CursorResult[Any], await self.session.execute(statement))
+        return result.rowcount
+
+    async def revoke_token_family(self, family_id: str) -> int:
+        """Revoke the live tokens of a family by family_id.
 
         This handles token reuse detection by revoking all tokens
-        that belong to the same family.
+        that belong to the same family. Already revoked or expired rows are
+        skipped so they are not rewritten; the partial family_id index covers the rest.
         """
+        now = datetime.now(timezone.utc)
         statement = (
-            update(self.model).where(self.model.family_id == family_id).values(revoked_at=datetime.now(timezone.utc))
+            update(self.model)
+            .where(self.model.family_id == family_id, self.model.revoked_at.is_(None), self.model.expires_at > now)
+            .values(revoked_at=now)
         )
-        await self.session.execute(statement)
+        result = cast(CursorResult[Any], await self.session.execute(statement))
+        return result.rowcount
 
-    async def revoke_all_for_user(self, user_id: int) -> None:
-        statement = (
-            update(self.model).where(self.model.user_id == user_id).values(revoked_at=datetime.now(timezone.utc))
+    async def revoke_all_for_user(self, user_id: int) -> int:
+        now = datetime.now(timezone.utc)
+        statement = update(self.model).where(self._is_live(user_id, now)).values(revoked_at=now)
+        result = cast(CursorResult[Any], await self.session.execute(statement))
+        return result.rowcount
+
+    async def delete_stale(self, before: datetime, limit: int) -> int:
+        # Expired tokens are rejected before the reuse check, so they no longer serve reuse detection.
+        # Rows locked by a rotation in flight are skipped and picked up by a later run
+        ctid: ColumnClause[Any] = literal_column("ctid")
+        batch = (
+            select(ctid)
+            .select_from(self.model)
+            .where(or_(self.model.expires_at < before, self.model.revoked_at < before))
+            .limit(limit)
+            .with_for_update(skip_locked=True)
         )
-        await self.session.execute(statement)
+        result = cast(CursorResult[Any], await self.session.execute(delete(self.model).where(ctid.in_(batch))))
+        return result.rowcount
+
+    def _is_live(self, user_id: int, now: datetime) -> ColumnElement[bool]:
+        """Filter on the user's unrevoked, unexpired tokens, served by the (user_id, revoked_at, expires_at) index."""
+        return and_(self.model.user_id == user_id, self.model.revoked_at.is_(None), self.model.expires_at > now)
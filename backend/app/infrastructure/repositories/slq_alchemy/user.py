@@ -1,27 +1,105 @@
 from __future__ import annotations
 
-from sqlalchemy import delete, select, update
+from sqlalchemy import delete, event, select, update
+from sqlalchemy.orm import Session
 
+from app import USER_CACHE_MAX_SIZE, USER_CACHE_TTL_SECONDS
 from app.core.domain import User
 from app.core.domain.user import OAuthProvider
 from app.core.repositories import IUserRepository
 from app.db.models import User as UserModel
+from app.utils.cache import CacheStats, TTLCache
 
 from .config import SQLAlchemyRepository
 
 
+class UserCache:
+    """User records keyed by id, with a secondary email -> id index sharing the same bounds.
+
+    Hits and misses are counted per user lookup, whichever key it goes through.
+    """
+
+    def __init__(self, max_size: int, ttl_seconds: float) -> None:
+        self.by_id: TTLCache[int, User] = TTLCache(max_size, ttl_seconds)
+        self.email_to_id: TTLCache[str, int] = TTLCache(max_size, ttl_seconds)
+        self.hits = 0
+        self.misses = 0
+
+    def get_by_id(self, user_id: int) -> User | None:
+        return self._count(self.by_id.get(user_id))
+
+    def get_by_email(self, email: str) -> User | None:
+        user_id = self.email_to_id.get(email)
+        user = self.by_id.get(user_id) if user_id is not None else None
+        return self._count(user if user is not None and user.email == email else None)
+
+    def set(self, user: User) -> None:
+        if user.id is None:
+            return
+        self.by_id.set(user.id, user.model_copy())
+        self.email_to_id.set(user.email, user.id)
+
+    def invalidate(self, user_id: int) -> None:
+        user = self.by_id.pop(user_id)
+        if user is not None:
+            self.email_to_id.pop(user.email)
+
+    def clear(self) -> None:
+        self.by_id.clear()
+        self.email_to_id.clear()
+        self.hits = 0
+        self.misses = 0
+
+    def stats(self) -> CacheStats:
+        stats = self.by_id.stats()
+        stats["hits"] = self.hits
+        stats["misses"] = self.misses
+        return stats
+
+    def _count(self, user: User | None) -> User | None:
+        if not self.by_id.enabled:
+            return None
+        if user is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        return user.model_copy()
+
+
+user_cache = UserCache(USER_CACHE_MAX_SIZE, USER_CACHE_TTL_SECONDS)
+
+# Ids of users written by the session's current transaction
+_WRITTEN_USER_IDS = "written_user_ids"
+
+
+@event.listens_for(Session, "after_commit")
+def _invalidate_committed_users(session: Session) -> None:
+    # A concurrent request may have re-cached the old row between the write and the commit
+    for user_id in session.info.pop(_WRITTEN_USER_IDS, ()):
+        user_cache.invalidate(user_id)
+
+
+@event.listens_for(Session, "after_soft_rollback")
+def _discard_written_users(session: Session, previous_transaction) -> None:
+    session.info.pop(_WRITTEN_USER_IDS, None)
+
+
 class UserSQLAlchemyRepository(SQLAlchemyRepository[UserModel], IUserRepository):
     model = UserModel
 
     async def get_by_email(self, email: str) -> User | None:
+        if cached := user_cache.get_by_email(email):
+            return cached
         statement = select(self.model).where(self.model.email == email)
         user = await self.session.scalar(statement)
-        return User.model_validate(user, from_attributes=True) if user else None
+        return self._cache(User.model_validate(user, from_attributes=True)) if user else None
 
     async def get_by_id(self, user_id: int) -> User | None:
+        if cached := user_cache.get_by_id(user_id):
+            return cached
         statement = select(self.model).where(self.model.id == user_id)
         user = await self.session.scalar(statement)
-        return User.model_validate(user, from_attributes=True) if user else None
+        return self._cache(User.model_validate(user, from_attributes=True)) if user else None
 
     async def get_by_oauth_id(self, oauth_provider: OAuthProvider, oauth_id: str) -> User | None:
         statement = select(self.model).where(
@@ -38,6 +116,7 @@ class UserSQLAlchemyRepository(SQLAlchemyRepository[UserModel], IUserRepository)
         return User.model_validate(user, from_attributes=True) if user else None
 
     async def update(self, user_id: int, **update_data) -> User | None:
+        self._invalidate(user_id)
         statement = update(self.model).where(self.model.id == user_id).values(update_data).returning(self.model)
         updated_user = await self.session.scalar(statement)
         return User.model_validate(updated_user, from_attributes=True) if updated_user else None
@@ -46,9 +125,21 @@ class UserSQLAlchemyRepository(SQLAlchemyRepository[UserModel], IUserRepository)
         user_model = self.model(**user.model_dump(exclude_computed_fields=True))
         self.session.add(user_model)
         await self.session.flush()
+        self._invalidate(user_model.id)
         return User.model_validate(user_model, from_attributes=True)
 
     async def delete(self, user_id: int) -> User | None:
+        self._invalidate(user_id)
         statement = delete(self.model).where(self.model.id == user_id).returning(self.model)
         deleted_user = await self.session.scalar(statement)
         return User.model_validate(deleted_user, from_attributes=True) if deleted_user else None
+
+    def _cache(self, user: User) -> User:
+        # Rows written by the open transaction may still be rolled back, so only cache clean reads
+        if not self.session.info.get(_WRITTEN_USER_IDS):
+            user_cache.set(user)
+        return user
+
+    def _invalidate(self, user_id: int) -> None:
+        self.session.info.setdefault(_WRITTEN_USER_IDS, set()).add(user_id)
+        user_cache.invalidate(user_id)
@@ -2,7 +2,8 @@ from __future__ import annotations
 
 from datetime import datetime, timezone
 
-from sqlalchemy import delete, select, update
+from sqlalchemy import delete, exists, func, select, update
+from sqlalchemy.dialects.postgresql import insert
 
 from app.core.domain.verification_token import VerificationToken as VerificationTokenDomain
 from app.core.repositories.verification_token_repository import IVerificationTokenRepository
@@ -20,6 +21,33 @@ class VerificationTokenSQLAlchemyRepository(SQLAlchemyRepository[VerificationTok
         await self.session.flush()
         return VerificationTokenDomain.model_validate(model, from_attributes=True)
 
+    async def replace_for_user(
+        self, token: VerificationTokenDomain, replace_before: datetime | None = None
+    ) -> datetime | None:
+        insert_statement = insert(self.model).values(
+            user_id=token.user_id, token_hash=token.token_hash, expires_at=token.expires_at
+        )
+        replaced = (
+            insert_statement.on_conflict_do_update(
+                index_elements=[self.model.user_id],
+                set_={
+                    "token_hash": insert_statement.excluded.token_hash,
+                    "expires_at": insert_statement.excluded.expires_at,
+                    "used_at": None,
+                    "time_create": func.current_timestamp(),
+                    "time_update": func.current_timestamp(),
+                },
+                where=self.model.time_create < replace_before if replace_before is not None else None,
+            )
+            .returning(self.model.id)
+            .cte("replaced")
+        )
+        # The outer SELECT reads the statement's starting snapshot, so it sees the kept row unchanged
+        statement = select(self.model.time_create).where(
+            self.model.user_id == token.user_id, ~exists(replaced.select())
+        )
+        return await self.session.scalar(statement)
+
     async def get_by_hash(self, token_hash: str) -> VerificationTokenDomain | None:
         statement = select(self.model).where(self.model.token_hash == token_hash)
         model = await self.session.scalar(statement)
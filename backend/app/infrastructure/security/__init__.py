@@ -1,4 +1,18 @@
-from .password_hasher import PwdlibHasher as PwdlibHasher
+from .hashing_pool import (
+    PasswordHashingPool as PasswordHashingPool,
+    password_hashing_pool as password_hashing_pool,
+)
+from .password_hasher import (
+    ARGON2_PROFILES as ARGON2_PROFILES,
+    Argon2Profile as Argon2Profile,
+    PwdlibHasher as PwdlibHasher,
+    get_argon2_profile as get_argon2_profile,
+)
+from .token_deny_list import (
+    InMemoryAccessTokenDenyList as InMemoryAccessTokenDenyList,
+    TransactionalAccessTokenDenyList as TransactionalAccessTokenDenyList,
+    access_token_deny_list as access_token_deny_list,
+)
 from .token_provider import (
     AccessTokenStrategy as AccessTokenStrategy,
     RefreshTokenStrategy as RefreshTokenStrategy,
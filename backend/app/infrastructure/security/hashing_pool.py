@@ -0,0 +1,72 @@
+import asyncio
+import threading
+import time
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from typing import TypedDict
+
+from app import PASSWORD_HASH_MAX_WORKERS
+
+
+class HashingPoolStats(TypedDict):
+    max_workers: int
+    queued: int
+    running: int
+    completed: int
+    avg_wait_ms: float
+    max_wait_ms: float
+
+
+class PasswordHashingPool:
+    """Bounded worker pool for CPU-bound password hashing.
+
+    argon2-cffi releases the GIL while hashing, so threads give real parallelism without the
+    pickling cost of a process pool. Calls beyond ``max_workers`` wait in the executor queue
+    instead of blocking the event loop; the wait time is recorded to size the pool.
+    """
+
+    def __init__(self, max_workers: int) -> None:
+        self.max_workers = max_workers
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="password-hash")
+        self._lock = threading.Lock()
+        self._queued = 0
+        self._running = 0
+        self._completed = 0
+        self._total_wait = 0.0
+        self._max_wait = 0.0
+
+    async def run[R](self, func: Callable[..., R], *args: object) -> R:
+        submitted_at = time.perf_counter()
+        with self._lock:
+            self._queued += 1
+
+        def task() -> R:
+            wait = time.perf_counter() - submitted_at
+            with self._lock:
+                self._queued -= 1
+                self._running += 1
+                self._total_wait += wait
+                self._max_wait = max(self._max_wait, wait)
+            try:
+                return func(*args)
+            finally:
+                with self._lock:
+                    self._running -= 1
+                    self._completed += 1
+
+        return await asyncio.get_running_loop().run_in_executor(self._executor, task)
+
+    def stats(self) -> HashingPoolStats:
+        with self._lock:
+            started = self._completed + self._running
+            return HashingPoolStats(
+                max_workers=self.max_workers,
+                queued=self._queued,
+                running=self._running,
+                completed=self._completed,
+                avg_wait_ms=self._total_wait / started * 1000 if started else 0.0,
+                max_wait_ms=self._max_wait * 1000,
+            )
+
+
+password_hashing_pool = PasswordHashingPool(PASSWORD_HASH_MAX_WORKERS)
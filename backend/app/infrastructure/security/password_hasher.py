@@ -1,14 +1,73 @@
+from typing import NamedTuple
+
 from pwdlib import PasswordHash
+from pwdlib.hashers.argon2 import Argon2Hasher
 
+from app import ARGON2_MEMORY_COST, ARGON2_PARALLELISM, ARGON2_TIME_COST, PASSWORD_HASH_PROFILE
 from app.core.security import IPasswordHasher
 
+from .hashing_pool import PasswordHashingPool, password_hashing_pool
+
+
+class Argon2Profile(NamedTuple):
+    time_cost: int
+    memory_cost: int  # KiB
+    parallelism: int
+
+
+# Memory cost has to leave headroom for concurrent hashes on the smaller Lambda tiers
+ARGON2_PROFILES: dict[str, Argon2Profile] = {
+    "recommended": Argon2Profile(time_cost=3, memory_cost=65536, parallelism=4),
+    "lambda-512": Argon2Profile(time_cost=2, memory_cost=19456, parallelism=1),
+    "lambda-1024": Argon2Profile(time_cost=2, memory_cost=47104, parallelism=1),
+    "lambda-2048": Argon2Profile(time_cost=3, memory_cost=65536, parallelism=1),
+}
+
+
+def get_argon2_profile(
+    name: str = PASSWORD_HASH_PROFILE,
+    time_cost: int | None = ARGON2_TIME_COST,
+    memory_cost: int | None = ARGON2_MEMORY_COST,
+    parallelism: int | None = ARGON2_PARALLELISM,
+) -> Argon2Profile:
+    """Resolve a named profile, letting explicitly configured parameters override it."""
+    try:
+        profile = ARGON2_PROFILES[name]
+    except KeyError:
+        msg = f"Unknown password hash profile {name!r}, expected one of {', '.join(ARGON2_PROFILES)}"
+        raise ValueError(msg) from None
+    return Argon2Profile(
+        time_cost=time_cost or profile.time_cost,
+        memory_cost=memory_cost or profile.memory_cost,
+        parallelism=parallelism or profile.parallelism,
+    )
+
 
 class PwdlibHasher(IPasswordHasher):
-    def __init__(self) -> None:
-        self.pwd_context = PasswordHash.recommended()
+    def __init__(
+        self,
+        *,
+        pool: PasswordHashingPool = password_hashing_pool,
+        profile: Argon2Profile | None = None,
+    ) -> None:
+        self.profile = profile or get_argon2_profile()
+        self.pwd_context = PasswordHash((Argon2Hasher(**self.profile._asdict()),))
+        self.pool = pool
 
     def hash(self, password: str) -> str:
         return self.pwd_context.hash(password)
 
     def verify(self, raw_password: str, hashed_password: str) -> bool:
         return self.pwd_context.verify(raw_password, hashed_password)
+
+    def verify_and_update(self, raw_password: str, hashed_password: str) -> tuple[bool, str | None]:
+        return self.pwd_context.verify_and_update(raw_password, hashed_password)
+
+    async def hash_async(self, password: str) -> str:
+        return await self.pool.run(self.hash, password)
+
+    async def verify_async(self, raw_password: str, hashed_password: str) -> bool:
+        return await self.pool.run(self.verify, raw_password, hashed_password)
+
+    async def verify_and_update_async(self, raw_password: str, hashed_password: str) -> tuple[bool, str | None]:
+        return await self.pool.run(self.verify_and_update, raw_password, hashed_password)
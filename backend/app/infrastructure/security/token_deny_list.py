@@ -0,0 +1,93 @@
+from collections import OrderedDict
+from datetime import UTC, datetime, timedelta
+
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session, SessionTransaction
+
+from app import ACCESS_TOKEN_EXPIRE_MINUTES
+from app.core.dto import AccessTokenPayload
+from app.core.security import IAccessTokenDenyList
+
+
+class InMemoryAccessTokenDenyList(IAccessTokenDenyList):
+    """Per-process deny-list keyed by user id.
+
+    Other processes (e.g. other Lambda containers) never see a denial, which is why claims are
+    only trusted on read-only endpoints; writes still load the user from the database.
+
+    An entry only has to outlive the access-token lifetime: after that every token issued
+    before the revocation has expired on its own, so the list stays small without a size cap.
+    """
+
+    def __init__(self, ttl_minutes: int = ACCESS_TOKEN_EXPIRE_MINUTES) -> None:
+        self.ttl = timedelta(minutes=ttl_minutes)
+        self._denied_at: OrderedDict[int, datetime] = OrderedDict()
+
+    def deny_user(self, user_id: int) -> None:
+        # JWT iat has whole seconds, so the denial is recorded with the same resolution
+        now = datetime.now(UTC).replace(microsecond=0)
+        self._denied_at.pop(user_id, None)
+        self._denied_at[user_id] = now
+        self._prune(now)
+
+    def is_denied(self, payload: AccessTokenPayload) -> bool:
+        denied_at = self._denied_at.get(payload.user_id)
+        if denied_at is None:
+            return False
+        # Tokens without an issue time can't be proven newer than the revocation. A token issued
+        # in the second of the denial may predate it, so it is rejected too; the client refreshes
+        return payload.iat is None or payload.iat <= denied_at
+
+    def clear(self) -> None:
+        self._denied_at.clear()
+
+    def _prune(self, now: datetime) -> None:
+        while self._denied_at:
+            user_id, denied_at = next(iter(self._denied_at.items()))
+            if now - denied_at < self.ttl:
+                break
+            del self._denied_at[user_id]
+
+
+_PENDING_DENIALS = "pending_access_token_denials"
+
+
+@event.listens_for(Session, "after_commit")
+def _apply_committed_denials(session: Session) -> None:
+    # Releasing a savepoint commits nothing yet; the denials wait for the outer transaction
+    if session.in_nested_transaction():
+        return
+    for deny_list, user_id in session.info.pop(_PENDING_DENIALS, []):
+        deny_list.deny_user(user_id)
+
+
+@event.listens_for(Session, "after_transaction_end")
+def _discard_pending_denials(session: Session, transaction: SessionTransaction) -> None:
+    # Runs after after_commit, so anything left belongs to a transaction that was rolled back
+    if transaction.parent is None:
+        session.info.pop(_PENDING_DENIALS, None)
+
+
+class TransactionalAccessTokenDenyList(IAccessTokenDenyList):
+    """Defers ``deny_user`` on the wrapped list until the session's transaction commits.
+
+    A revocation whose transaction is rolled back (e.g. a failed password change) then leaves
+    the user's access tokens valid.
+    """
+
+    def __init__(self, session: AsyncSession, deny_list: IAccessTokenDenyList) -> None:
+        self.session = session
+        self.deny_list = deny_list
+
+    def deny_user(self, user_id: int) -> None:
+        # Begin the transaction the denial belongs to, so a rollback before any query still ends it
+        if not self.session.in_transaction():
+            self.session.sync_session.begin()
+        self.session.info.setdefault(_PENDING_DENIALS, []).append((self.deny_list, user_id))
+
+    def is_denied(self, payload: AccessTokenPayload) -> bool:
+        return self.deny_list.is_denied(payload)
+
+
+access_token_deny_list = InMemoryAccessTokenDenyList()
@@ -51,8 +51,10 @@ class AccessTokenStrategy(ITokenStrategy[AccessTokenPayload]):
         self.expires_in_minutes = expires_in_minutes
 
     def create_token(self, payload: AccessTokenPayload) -> Token[AccessTokenPayload]:
+        if payload.iat is None:
+            payload.iat = datetime.now(timezone.utc)
         if payload.exp is None:
-            payload.exp = datetime.now(timezone.utc) + timedelta(minutes=self.expires_in_minutes)
+            payload.exp = payload.iat + timedelta(minutes=self.expires_in_minutes)
         token = self.provider.create(payload)
         return Token(token=token, type=payload.type, payload=payload)
 
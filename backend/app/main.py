@@ -1,11 +1,19 @@
 from __future__ import annotations
 
+import asyncio
+import logging
+import os
+
 from fastapi import FastAPI
 from fastapi.middleware.trustedhost import TrustedHostMiddleware
 from fastapi.routing import APIRoute
 from mangum import Mangum
 
-from app import ALLOWED_HOSTS
+from app import ALLOWED_HOSTS, HEALTH_STATS_ENABLED, env
+from app.db import engine, replica_engine, warm_up_engine
+from app.infrastructure.repositories.slq_alchemy.company import company_cache
+from app.infrastructure.repositories.slq_alchemy.user import user_cache
+from app.infrastructure.security import password_hashing_pool
 from app.routers import application, auth, company, oauth, user
 
 
@@ -26,10 +34,46 @@ async def test_endpoint():
     return {"message": "The backend is running."}
 
 
+async def stats_endpoint():
+    return {
+        "db_pool": engine.pool.status(),
+        "db_replica_pool": replica_engine.pool.status() if replica_engine is not None else None,
+        "user_cache": user_cache.stats(),
+        "company_cache": company_cache.stats(),
+        "password_hashing_pool": password_hashing_pool.stats(),
+    }
+
+
+if HEALTH_STATS_ENABLED:
+    app.add_api_route("/health/stats", stats_endpoint, methods=["GET"], tags=["health"], include_in_schema=False)
+
+
 app.include_router(user.router)
 app.include_router(application.router)
 app.include_router(company.router)
 app.include_router(auth.router)
 app.include_router(oauth.router)
 
-handler = Mangum(app)
+
+def warm_up() -> None:
+    """Connect during the Lambda init phase so the first invocation skips connection setup.
+
+    Mangum drives every invocation on the thread's default event loop, and asyncpg
+    connections are bound to the loop that created them, so the warm-up runs on that loop.
+    """
+    loop = asyncio.new_event_loop()
+    asyncio.set_event_loop(loop)
+    try:
+        loop.run_until_complete(warm_up_engine())
+        if replica_engine is not None:
+            loop.run_until_complete(warm_up_engine(replica_engine))
+    except Exception:
+        # A failed warm-up must not fail the init phase, the first request will connect instead
+        logging.getLogger(__name__).exception("Database warm-up failed")
+
+
+if env.bool("DB_WARM_UP", "AWS_LAMBDA_FUNCTION_NAME" in os.environ):
+    warm_up()
+
+# Mangum would run the (empty) lifespan startup and shutdown around every invocation
+handler = Mangum(app, lifespan="off")
@@ -1,18 +1,35 @@
-from fastapi import APIRouter, HTTPException, Query, status
+import csv
+
+from fastapi import APIRouter, HTTPException, Query, UploadFile, status
+from fastapi.responses import StreamingResponse
 from typing_extensions import Annotated
 
 from app import Tags
 from app.base_schemas import ErrorResponse
 from app.core.dto import (
+    ApplicationBatchDeleteParams,
+    ApplicationBatchDeleteResult,
+    ApplicationBatchUpdate,
     ApplicationCreate,
+    ApplicationFileFormat,
     ApplicationFilterParams,
+    ApplicationImportResult,
     ApplicationRead,
     ApplicationReadWithCompany,
+    ApplicationSearchParams,
+    ApplicationStats,
+    ApplicationStatsParams,
     ApplicationUpdate,
     PaginatedResponse,
 )
-from app.core.exceptions import ApplicationNotFoundError, UserNotAuthorizedError
-from app.dependencies import ActiveUserDep, ApplicationServiceDep
+from app.core.exceptions import ApplicationImportLimitError, ApplicationNotFoundError, UserNotAuthorizedError
+from app.dependencies import (
+    ActiveUserClaimsDep,
+    ApplicationServiceDep,
+    ReadActiveUserClaimsDep,
+    ReadApplicationServiceDep,
+)
+from app.utils import EXPORT_MEDIA_TYPES, guess_file_format, iter_export, iter_import_rows
 
 router = APIRouter(prefix="/applications", tags=[Tags.APPLICATION])
 
@@ -24,30 +41,173 @@ router = APIRouter(prefix="/applications", tags=[Tags.APPLICATION])
     },
 )
 async def get_applications(
-    app_service: ApplicationServiceDep,
-    user: ActiveUserDep,
+    app_service: ReadApplicationServiceDep,
+    user: ReadActiveUserClaimsDep,
     filter_param: Annotated[ApplicationFilterParams, Query()],
 ) -> PaginatedResponse[ApplicationReadWithCompany]:
-    apps, total, has_more = await app_service.get_applications_by_user_email(user.email, filter_param)
+    apps, total, has_more, next_cursor = await app_service.get_applications_by_user_id(user.user_id, filter_param)
     return PaginatedResponse(
         items=apps,
         total=total,
         limit=filter_param.limit,
         offset=filter_param.offset,
         has_more=has_more,
+        next_cursor=next_cursor,
     )
 
 
+@router.get(
+    "/search",
+    responses={
+        status.HTTP_401_UNAUTHORIZED: {"description": "Access token is invalid", "model": ErrorResponse},
+    },
+)
+async def search_applications(
+    app_service: ReadApplicationServiceDep,
+    user: ReadActiveUserClaimsDep,
+    search_param: Annotated[ApplicationSearchParams, Query()],
+) -> list[ApplicationReadWithCompany]:
+    """
+    **Search** the user's applications by role and company name.
+
+    Matching tolerates typos; results are ordered by relevance.
+    """
+    return await app_service.search(user.user_id, search_param)
+
+
+@router.get(
+    "/export",
+    response_class=StreamingResponse,
+    responses={
+        status.HTTP_200_OK: {"content": {media_type: {} for media_type in EXPORT_MEDIA_TYPES.values()}},
+        status.HTTP_401_UNAUTHORIZED: {"description": "Access token is invalid", "model": ErrorResponse},
+    },
+)
+async def export_applications(
+    app_service: ApplicationServiceDep,
+    user: ActiveUserClaimsDep,
+    file_format: Annotated[ApplicationFileFormat, Query(alias="format")] = ApplicationFileFormat.csv,
+) -> StreamingResponse:
+    """
+    **Export** all of the user's applications with company names as CSV or NDJSON.
+
+    The file uses the import columns, so it can be imported again.
+    """
+    # Uses the transactional session: the server-side cursor behind the stream needs a transaction
+    return StreamingResponse(
+        iter_export(app_service.export_applications(user.user_id), file_format),
+        media_type=EXPORT_MEDIA_TYPES[file_format],
+        headers={"Content-Disposition": f'attachment; filename="applications.{file_format}"'},
+    )
+
+
+@router.get(
+    "/stats",
+    responses={
+        status.HTTP_401_UNAUTHORIZED: {"description": "Access token is invalid", "model": ErrorResponse},
+    },
+)
+async def get_application_stats(
+    app_service: ReadApplicationServiceDep,
+    user: ReadActiveUserClaimsDep,
+    stats_param: Annotated[ApplicationStatsParams, Query()],
+) -> ApplicationStats:
+    """
+    **Count** the user's applications by status, work type and work location, and per week.
+    """
+    return await app_service.get_stats(user.user_id, stats_param)
+
+
 @router.post("")
 async def create_application(
     app_service: ApplicationServiceDep,
     app: ApplicationCreate,
-    user: ActiveUserDep,
+    user: ActiveUserClaimsDep,
 ) -> ApplicationRead:
-    application = await app_service.create(app, user.id)
+    application = await app_service.create(app, user.user_id)
     return application
 
 
+@router.post(
+    "/import",
+    responses={
+        status.HTTP_400_BAD_REQUEST: {
+            "description": "File format is unknown or the file is malformed",
+            "model": ErrorResponse,
+        },
+        status.HTTP_401_UNAUTHORIZED: {"description": "Access token is invalid", "model": ErrorResponse},
+        status.HTTP_413_CONTENT_TOO_LARGE: {"description": "File has too many rows", "model": ErrorResponse},
+    },
+)
+async def import_applications(
+    app_service: ApplicationServiceDep,
+    user: ActiveUserClaimsDep,
+    file: UploadFile,
+    file_format: Annotated[
+        ApplicationFileFormat | None,
+        Query(alias="format", description="Defaults to the format implied by the file extension"),
+    ] = None,
+) -> ApplicationImportResult:
+    """
+    **Import** applications from a CSV file with a header row or from NDJSON (one JSON object per line).
+
+    Columns match the application fields, with the company given by name in a `company` column.
+    Invalid rows are skipped and reported by line number; the remaining rows are imported.
+    """
+    file_format = file_format or guess_file_format(file.filename)
+    if file_format is None:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Unknown file format, use a .csv or .ndjson file or set the format parameter",
+        )
+    try:
+        return await app_service.import_applications(user.user_id, iter_import_rows(file.file, file_format))
+    except ApplicationImportLimitError as e:
+        raise HTTPException(status_code=status.HTTP_413_CONTENT_TOO_LARGE, detail=str(e))
+    except (UnicodeDecodeError, csv.Error) as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=f"File could not be read: {e}")
+
+
+@router.patch(
+    "/batch",
+    responses={
+        status.HTTP_401_UNAUTHORIZED: {"description": "Access token is invalid", "model": ErrorResponse},
+        status.HTTP_403_FORBIDDEN: {"description": "User is not active", "model": ErrorResponse},
+    },
+)
+async def update_applications(
+    app_service: ApplicationServiceDep,
+    batch: ApplicationBatchUpdate,
+    user: ActiveUserClaimsDep,
+) -> list[ApplicationRead]:
+    """
+    **Update** several applications with the same changes and return the updated ones.
+
+    Ids that do not exist or belong to another user are skipped.
+    """
+    return await app_service.update_many(batch, user.user_id)
+
+
+@router.delete(
+    "/batch",
+    responses={
+        status.HTTP_401_UNAUTHORIZED: {"description": "Access token is invalid", "model": ErrorResponse},
+        status.HTTP_403_FORBIDDEN: {"description": "User is not active", "model": ErrorResponse},
+    },
+)
+async def delete_applications(
+    app_service: ApplicationServiceDep,
+    params: Annotated[ApplicationBatchDeleteParams, Query()],
+    user: ActiveUserClaimsDep,
+) -> ApplicationBatchDeleteResult:
+    """
+    **Delete** several applications and return the ids that were deleted.
+
+    Ids that do not exist or belong to another user are skipped.
+    """
+    return ApplicationBatchDeleteResult(ids=await app_service.delete_many(params, user.user_id))
+
+
 @router.get(
     "/{application_id}",
     responses={
@@ -61,11 +221,11 @@ async def create_application(
 )
 async def get_application_by_id(
     application_id: int,
-    app_service: ApplicationServiceDep,
-    user: ActiveUserDep,
+    app_service: ReadApplicationServiceDep,
+    user: ReadActiveUserClaimsDep,
 ) -> ApplicationRead:
     try:
-        application = await app_service.get_by_id(application_id, user.id)
+        application = await app_service.get_by_id(application_id, user.user_id)
     except ApplicationNotFoundError as e:
         raise HTTPException(status_code=404, detail=str(e))
     except UserNotAuthorizedError as e:
@@ -88,10 +248,10 @@ async def update_application(
     application_id: int,
     app_service: ApplicationServiceDep,
     app: ApplicationUpdate,
-    user: ActiveUserDep,
+    user: ActiveUserClaimsDep,
 ) -> ApplicationRead:
     try:
-        application = await app_service.update(application_id, app, user.id)
+        application = await app_service.update(application_id, app, user.user_id)
     except ApplicationNotFoundError as e:
         raise HTTPException(status_code=404, detail=str(e))
     except UserNotAuthorizedError as e:
@@ -111,9 +271,11 @@ async def update_application(
         },
     },
 )
-async def delete_application(application_id: int, app_service: ApplicationServiceDep, user: ActiveUserDep) -> None:
+async def delete_application(
+    application_id: int, app_service: ApplicationServiceDep, user: ActiveUserClaimsDep
+) -> None:
     try:
-        await app_service.delete(application_id, user.id)
+        await app_service.delete(application_id, user.user_id)
     except ApplicationNotFoundError as e:
         raise HTTPException(status_code=404, detail=str(e))
     except UserNotAuthorizedError as e:
@@ -7,7 +7,7 @@ from typing_extensions import Annotated, Literal
 
 from app import Tags
 from app.base_schemas import ErrorResponse
-from app.core.dto import AccessTokenResponse, UserLogin
+from app.core.dto import AccessTokenResponse, UserLogin, UserSessionRead
 from app.core.exceptions import (
     InvalidPasswordError,
     RefreshTokenReuseError,
@@ -17,7 +17,7 @@ from app.core.exceptions import (
     UserNotFoundError,
 )
 from app.core.exceptions.user import UserNotActivatedError
-from app.dependencies import AuthServiceDep, RefreshTokenDep
+from app.dependencies import AuthServiceDep, ReadActiveUserClaimsDep, ReadRefreshTokenServiceDep, RefreshTokenDep
 
 
 @dataclass
@@ -98,6 +98,25 @@ async def refresh_token(
     return AccessTokenResponse(access_token=access.token)
 
 
+@router.get(
+    "/sessions",
+    responses={
+        status.HTTP_401_UNAUTHORIZED: {"description": "Access token is invalid", "model": ErrorResponse},
+    },
+)
+async def list_sessions(
+    refresh_token_service: ReadRefreshTokenServiceDep,
+    user: ReadActiveUserClaimsDep,
+    refresh: Annotated[str | None, Cookie()] = None,
+) -> list[UserSessionRead]:
+    """
+    **List** the user's active sessions (logins whose refresh token is still valid).
+
+    A new login revokes the least recently refreshed session once the per-user limit is reached.
+    """
+    return await refresh_token_service.list_sessions(user.user_id, refresh)
+
+
 @router.post(
     "/logout",
     status_code=status.HTTP_204_NO_CONTENT,
@@ -23,7 +23,13 @@ from app.core.exceptions import (
     UserAlreadyExistError,
     UserNotFoundError,
 )
-from app.dependencies import AccessTokenDep, AccessTokenPayloadDep, UserEmailServiceDep, UserServiceDep
+from app.dependencies import (
+    AccessTokenDep,
+    AccessTokenPayloadDep,
+    ReadUserServiceDep,
+    UserEmailServiceDep,
+    UserServiceDep,
+)
 
 from .auth import RefreshTokenSettings
 
@@ -138,10 +144,10 @@ async def resend_activation_email(
     try:
         from app import RESEND_ACTIVATION_COOLDOWN_MINUTES
 
-        user = await user_service.resend_activation_email(
+        user, raw_token = await user_service.resend_activation_email(
             form_data.email, cooldown_minutes=RESEND_ACTIVATION_COOLDOWN_MINUTES
         )
-        await email_service.send_verification_email(user)
+        await email_service.send_verification_email(user, raw_token)
         return MessageResponse(
             message=f"If an account exists with {form_data.email}, an activation email has been sent"
         )
@@ -270,7 +276,7 @@ async def set_password(
         },
     },
 )
-async def get_current_user(access_token: AccessTokenDep, user_service: UserServiceDep) -> UserRead:
+async def get_current_user(access_token: AccessTokenDep, user_service: ReadUserServiceDep) -> UserRead:
     """
     **Get** current user information.
 
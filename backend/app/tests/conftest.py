@@ -8,12 +8,14 @@ from app.core.security import IPasswordHasher
 from app.core.services.verification_token_service import VerificationTokenService
 from app.db import url_object
 from app.db.models import Base
-from app.dependencies import get_session
+from app.dependencies import get_read_session, get_session
 from app.infrastructure.repositories import (
     ApplicationSQLAlchemyRepository,
     CompanySQLAlchemyRepository,
     UserSQLAlchemyRepository,
 )
+from app.infrastructure.repositories.slq_alchemy.company import company_autocomplete_cache, company_cache
+from app.infrastructure.repositories.slq_alchemy.user import user_cache
 from app.infrastructure.repositories.slq_alchemy.verification_token import VerificationTokenSQLAlchemyRepository
 from app.infrastructure.security import (
     AccessTokenStrategy,
@@ -69,13 +71,33 @@ async def session_fixture(engine):
     await connection.close()
 
 
+@pytest.fixture(autouse=True)
+def clear_caches():
+    """Cached rows would outlive the per-test rollback."""
+    yield
+    company_cache.clear()
+    company_autocomplete_cache.clear()
+    user_cache.clear()
+
+
 @pytest.fixture(autouse=True)
 async def override_session_dependency(session):
     app.dependency_overrides[get_session] = lambda: session
+    app.dependency_overrides[get_read_session] = lambda: session
     yield
     app.dependency_overrides.clear()
 
 
+@pytest.fixture(name="forbid_primary_session")
+def forbid_primary_session_fixture(monkeypatch):
+    """Fail the request if it opens the transactional session, for endpoints that must only read."""
+
+    def primary_session():
+        raise AssertionError("Read-only endpoint requested the transactional session")
+
+    monkeypatch.setitem(app.dependency_overrides, get_session, primary_session)
+
+
 @pytest.fixture(name="client_config")
 def client_config():
     """Provide default client configuration for tests. Can be overridden in individual tests if needed."""
@@ -23,7 +23,7 @@ def access_token_factory(access_token_strategy: ITokenStrategy[AccessTokenPayloa
             Token[AccessTokenPayload]: Access token with payload
         """
         assert user.id is not None, "User ID must be set to create access token"
-        payload = AccessTokenPayload(user_email=user.email, user_id=user.id)
+        payload = AccessTokenPayload(user_email=user.email, user_id=user.id, is_active=user.is_active)
         return access_token_strategy.create_token(payload)
 
     return create_access_token
@@ -1,12 +1,20 @@
-from datetime import datetime
+import csv
+import io
+import json
+from datetime import UTC, datetime, timedelta
 
 import pytest
 from httpx import AsyncClient
+from sqlalchemy import event, func, select
 
-from app.core.domain import User
+from app.core.domain import AppStatus, User, WorkLocation
 from app.core.domain.application import Application
 from app.core.domain.company import Company
+from app.core.dto import AccessTokenPayload, ApplicationExportRow
 from app.core.dto.application import ApplicationCreate
+from app.db.models import Application as ApplicationModel, Company as CompanyModel
+from app.infrastructure.repositories import UserSQLAlchemyRepository
+from app.infrastructure.security import access_token_deny_list
 
 
 @pytest.fixture(name="user", autouse=True)
@@ -167,6 +175,23 @@ class TestApplicationUpdate:
             "detail": f"User with {another_user.id} id is not authorized to update this application"
         }
 
+    async def test_with_non_authorized_user_leaves_application_unchanged(
+        self, client: AsyncClient, application: Application, user_factory, access_token_factory, application_repo
+    ):
+        another_user = await user_factory()
+        access_token = access_token_factory(another_user)
+
+        for payload in ({"role": "Updated Role"}, {}):
+            response = await client.patch(
+                self.url.format(id=application.id),
+                headers={"Authorization": f"Bearer {access_token.token}"},
+                json=payload,
+            )
+            assert response.status_code == 403
+
+        database_entity = await application_repo.get_by_id(application.id)
+        assert database_entity.role == application.role
+
     async def test_with_existent_company(
         self,
         client: AsyncClient,
@@ -358,6 +383,69 @@ class TestApplicationDelete:
         assert response2.json() == {"detail": f"Application with {application.id} id is not found"}
 
 
+class TestApplicationBatch:
+    url: str = "/applications/batch"
+
+    async def test_batch_update(self, client: AsyncClient, user: User, session, application_factory):
+        apps = await application_factory.batch(3, user_id=user.id)
+        other_app = await application_factory()
+        ids = [apps[0].id, apps[1].id, other_app.id]
+
+        response = await client.patch(self.url, json={"ids": ids, "changes": {"status": "rejected"}})
+
+        assert response.status_code == 200
+        assert sorted(item["id"] for item in response.json()) == [apps[0].id, apps[1].id]
+        assert {item["status"] for item in response.json()} == {"rejected"}
+        statuses = dict((await session.execute(select(ApplicationModel.id, ApplicationModel.status))).all())
+        assert statuses[apps[2].id] == AppStatus.APPLIED
+        assert statuses[other_app.id] == AppStatus.APPLIED
+
+    async def test_batch_update_company(self, client: AsyncClient, user: User, application_factory):
+        apps = await application_factory.batch(2, user_id=user.id)
+
+        response = await client.patch(
+            self.url, json={"ids": [app.id for app in apps], "changes": {"company": {"name": "Batch Company"}}}
+        )
+
+        assert response.status_code == 200
+        assert len({item["company_id"] for item in response.json()}) == 1
+
+    async def test_batch_update_without_changes(self, client: AsyncClient, application: Application):
+        response = await client.patch(self.url, json={"ids": [application.id], "changes": {}})
+
+        assert response.status_code == 422
+
+    async def test_batch_update_too_many_ids(self, client: AsyncClient):
+        response = await client.patch(self.url, json={"ids": list(range(1, 102)), "changes": {"status": "offer"}})
+
+        assert response.status_code == 422
+
+    async def test_batch_delete(self, client: AsyncClient, user: User, session, application_factory):
+        apps = await application_factory.batch(3, user_id=user.id)
+        other_app = await application_factory()
+
+        response = await client.delete(self.url, params={"ids": [apps[0].id, apps[1].id, other_app.id]})
+
+        assert response.status_code == 200
+        assert sorted(response.json()["ids"]) == [apps[0].id, apps[1].id]
+        remaining = (await session.scalars(select(ApplicationModel.id))).all()
+        assert sorted(remaining) == sorted([apps[2].id, other_app.id])
+
+    async def test_batch_delete_without_ids(self, client: AsyncClient):
+        response = await client.delete(self.url)
+
+        assert response.status_code == 422
+
+    async def test_batch_without_access_token(self, client: AsyncClient, application: Application):
+        del client.headers["Authorization"]
+
+        patch_response = await client.patch(self.url, json={"ids": [application.id], "changes": {"status": "offer"}})
+        delete_response = await client.delete(self.url, params={"ids": [application.id]})
+
+        assert patch_response.status_code == 401
+        assert delete_response.status_code == 401
+
+
 class TestApplicationGetById:
     url: str = "/applications/{id}"
 
@@ -476,6 +564,32 @@ class TestApplicationList:
             assert "company" in item and isinstance(item["company"], dict)
             assert item["user_id"] == user.id
 
+    async def test_list_embeds_companies_without_query_per_row(
+        self, client: AsyncClient, user: User, engine, company_factory, application_factory
+    ):
+        statements: list[str] = []
+
+        def count_statement(conn, cursor, statement, parameters, context, executemany):
+            statements.append(statement)
+
+        async def count_list_statements() -> int:
+            statements.clear()
+            event.listen(engine.sync_engine, "before_cursor_execute", count_statement)
+            try:
+                resp = await client.get(self.url)
+            finally:
+                event.remove(engine.sync_engine, "before_cursor_execute", count_statement)
+            assert resp.status_code == 200
+            return len(statements)
+
+        await application_factory(user_id=user.id)
+        single_row_statements = await count_list_statements()
+        for company in await company_factory.batch(4):
+            await application_factory(user_id=user.id, company_id=company.id)
+
+        assert await count_list_statements() == single_row_statements
+        assert len({item["company"]["id"] for item in (await client.get(self.url)).json()["items"]}) == 5
+
     async def test_list_applications_pagination(self, client: AsyncClient, user: User, application_factory):
         await application_factory.batch(15, user_id=user.id)
 
@@ -499,6 +613,57 @@ class TestApplicationList:
         assert page3["offset"] == 10
         assert page3["has_more"] is False
 
+    @pytest.mark.parametrize("order_direction", ["asc", "desc"])
+    async def test_list_applications_cursor_pagination(
+        self, order_direction: str, client: AsyncClient, user: User, application_factory
+    ):
+        # Equal timestamps force the id tie-breaker to keep pages stable
+        created = await application_factory.batch(7, user_id=user.id, time_create=datetime(2025, 1, 1, 12, 0, 0))
+        params = {"limit": 3, "order_direction": order_direction}
+
+        resp = await client.get(self.url, params=params)
+        page = resp.json()
+        seen = [item["id"] for item in page["items"]]
+        while page["has_more"]:
+            assert page["next_cursor"] is not None
+            resp = await client.get(self.url, params={**params, "cursor": page["next_cursor"]})
+            assert resp.status_code == 200
+            page = resp.json()
+            assert page["total"] == 7
+            seen.extend(item["id"] for item in page["items"])
+
+        assert page["next_cursor"] is None
+        assert seen == sorted((app.id for app in created), reverse=order_direction == "desc")
+
+    async def test_list_applications_without_total(self, client: AsyncClient, user: User, application_factory):
+        await application_factory.batch(6, user_id=user.id)
+
+        resp1 = await client.get(self.url, params={"limit": 3, "include_total": False})
+        page1 = resp1.json()
+        assert resp1.status_code == 200
+        assert len(page1["items"]) == 3
+        assert page1["total"] is None
+        assert page1["has_more"] is True
+
+        resp2 = await client.get(self.url, params={"limit": 3, "offset": 3, "include_total": False})
+        page2 = resp2.json()
+        assert len(page2["items"]) == 3
+        assert page2["total"] is None
+        assert page2["has_more"] is False
+
+    async def test_list_applications_invalid_cursor(self, client: AsyncClient):
+        resp = await client.get(self.url, params={"cursor": "not-a-cursor"})
+        assert resp.status_code == 422
+
+    async def test_list_applications_cursor_order_mismatch(self, client: AsyncClient, user: User, application_factory):
+        await application_factory.batch(3, user_id=user.id)
+        first = (await client.get(self.url, params={"limit": 1})).json()
+
+        resp = await client.get(
+            self.url, params={"limit": 1, "order_by": "time_update", "cursor": first["next_cursor"]}
+        )
+        assert resp.status_code == 422
+
     async def test_list_applications_ordering(self, client: AsyncClient, user: User, application_factory):
         # Create apps with known timestamps
         base = datetime(2025, 1, 1, 12, 0, 0)
@@ -541,6 +706,14 @@ class TestApplicationList:
         assert resp.status_code == 403
         assert resp.json() == {"detail": "User account is not activated"}
 
+    async def test_list_uses_read_session(
+        self, client: AsyncClient, client_config, application, forbid_primary_session
+    ):
+        resp = await client.get(self.url, **client_config)
+
+        assert resp.status_code == 200
+        assert [item["id"] for item in resp.json()["items"]] == [application.id]
+
     async def test_list_empty(self, client: AsyncClient, user_factory, access_token_factory):
         user = await user_factory()
         access = access_token_factory(user)
@@ -552,6 +725,63 @@ class TestApplicationList:
         assert body["has_more"] is False
 
 
+class TestStatelessAccessToken:
+    url: str = "/applications"
+
+    @pytest.fixture(autouse=True)
+    def stateless_auth(self, monkeypatch):
+        monkeypatch.setattr("app.dependencies.STATELESS_AUTH", True)
+        access_token_deny_list.clear()
+        yield
+        access_token_deny_list.clear()
+
+    async def test_user_not_loaded(self, client: AsyncClient, client_config, mocker):
+        get_by_email_spy = mocker.spy(UserSQLAlchemyRepository, "get_by_email")
+
+        resp = await client.get(self.url, **client_config)
+
+        assert resp.status_code == 200
+        get_by_email_spy.assert_not_called()
+
+    async def test_inactive_claim(self, client: AsyncClient, user_factory, access_token_factory):
+        user = await user_factory(is_active=False)
+        access = access_token_factory(user)
+
+        resp = await client.get(self.url, headers={"Authorization": f"Bearer {access.token}"})
+
+        assert resp.status_code == 403
+        assert resp.json() == {"detail": "User account is not activated"}
+
+    async def test_revoked_token(self, client: AsyncClient, client_config, user: User):
+        assert user.id is not None
+        access_token_deny_list.deny_user(user.id)
+
+        resp = await client.get(self.url, **client_config)
+
+        assert resp.status_code == 401
+        assert resp.json() == {"detail": "Token has been revoked"}
+
+    async def test_write_loads_user(self, client: AsyncClient, client_config, user: User, user_repo):
+        assert user.id is not None
+        await user_repo.update(user.id, is_active=False)
+
+        resp = await client.delete("/applications/999999", **client_config)
+
+        assert resp.status_code == 403
+        assert resp.json() == {"detail": "User account is not activated"}
+
+    async def test_token_without_claim_loads_user(self, client: AsyncClient, user: User, access_token_strategy, mocker):
+        assert user.id is not None
+        payload = AccessTokenPayload(user_email=user.email, user_id=user.id)
+        access = access_token_strategy.create_token(payload)
+        get_by_email_spy = mocker.spy(UserSQLAlchemyRepository, "get_by_email")
+
+        resp = await client.get(self.url, headers={"Authorization": f"Bearer {access.token}"})
+
+        assert resp.status_code == 200
+        get_by_email_spy.assert_called_once()
+
+
 class TestApplicationListFilters:
     url: str = "/applications"
 
@@ -630,6 +860,242 @@ class TestApplicationListFilters:
         assert data[0]["company"]["name"].startswith("Acme")
 
 
+class TestApplicationSearch:
+    url: str = "/applications/search"
+
+    async def test_search_by_role_with_typo(
+        self, client: AsyncClient, user: User, user_factory, company_factory, application_factory
+    ):
+        company = await company_factory(name="Initech")
+        other = await user_factory()
+        backend = await application_factory(user_id=user.id, company_id=company.id, role="Backend Engineer")
+        await application_factory(user_id=user.id, company_id=company.id, role="Product Manager")
+        await application_factory(user_id=other.id, company_id=company.id, role="Backend Engineer")
+
+        resp = await client.get(self.url, params={"query": "enginer"})
+
+        assert resp.status_code == 200
+        data = resp.json()
+        assert [item["id"] for item in data] == [backend.id]
+        assert data[0]["company"]["name"] == "Initech"
+
+    async def test_search_by_company_name(self, client: AsyncClient, user: User, company_factory, application_factory):
+        acme = await company_factory(name="Acme Holdings")
+        globex = await company_factory(name="Globex")
+        acme_app = await application_factory(user_id=user.id, company_id=acme.id)
+        await application_factory(user_id=user.id, company_id=globex.id)
+
+        resp = await client.get(self.url, params={"query": "acme"})
+
+        assert resp.status_code == 200
+        assert [item["id"] for item in resp.json()] == [acme_app.id]
+
+    async def test_search_respects_limit(self, client: AsyncClient, user: User, application_factory):
+        await application_factory.batch(5, user_id=user.id, role="Data Engineer")
+
+        resp = await client.get(self.url, params={"query": "engineer", "limit": 2})
+
+        assert resp.status_code == 200
+        assert len(resp.json()) == 2
+
+    async def test_search_without_query(self, client: AsyncClient):
+        resp = await client.get(self.url)
+        assert resp.status_code == 422
+
+
+class TestApplicationImport:
+    url: str = "/applications/import"
+
+    async def test_import_csv(self, client: AsyncClient, company: Company, session, user: User):
+        content = (
+            "role,company,status,work_type,note\n"
+            f"Backend Developer,{company.name},interview,,Referral\n"
+            "Data Engineer,Imported Corp,,,\n"
+            "Frontend Developer,Imported Corp,unknown,,\n"
+            "Platform Engineer,Imported Corp,offer,contract,\n"
+        )
+
+        response = await client.post(self.url, files={"file": ("applications.csv", content, "text/csv")})
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["imported"] == 3
+        assert [error["row"] for error in data["errors"]] == [4]
+        assert data["errors"][0]["detail"].startswith("status:")
+
+        apps = (
+            await session.execute(
+                select(ApplicationModel.role, ApplicationModel.status, CompanyModel.name)
+                .join(CompanyModel)
+                .where(ApplicationModel.user_id == user.id)
+                .order_by(ApplicationModel.id)
+            )
+        ).all()
+        assert [(role, status.value, name) for role, status, name in apps] == [
+            ("Backend Developer", "interview", company.name),
+            ("Data Engineer", "applied", "Imported Corp"),
+            ("Platform Engineer", "offer", "Imported Corp"),
+        ]
+        company_count = await session.scalar(
+            select(func.count()).select_from(CompanyModel).where(CompanyModel.name == "Imported Corp")
+        )
+        assert company_count == 1
+
+    async def test_import_ndjson(self, client: AsyncClient):
+        content = '{"role": "Backend Developer", "company": "Acme"}\n\n{"role": "Broken"\n{"company": "Acme"}\n'
+
+        response = await client.post(
+            self.url,
+            params={"format": "ndjson"},
+            files={"file": ("export.txt", content, "application/x-ndjson")},
+        )
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["imported"] == 1
+        assert [error["row"] for error in data["errors"]] == [3, 4]
+        assert "role: Field required" in data["errors"][1]["detail"]
+
+    async def test_import_empty_company(self, client: AsyncClient, session):
+        content = '{"role": "Backend Developer", "company": ""}\n'
+
+        response = await client.post(
+            self.url,
+            params={"format": "ndjson"},
+            files={"file": ("export.txt", content, "application/x-ndjson")},
+        )
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["imported"] == 0
+        assert [error["row"] for error in data["errors"]] == [1]
+        assert data["errors"][0]["detail"].startswith("company: String should have at least 1 character")
+        assert await session.scalar(select(func.count()).select_from(CompanyModel).where(CompanyModel.name == "")) == 0
+
+    async def test_import_unknown_format(self, client: AsyncClient):
+        response = await client.post(self.url, files={"file": ("applications.xlsx", b"data")})
+
+        assert response.status_code == 400
+
+    async def test_import_row_limit(self, client: AsyncClient, monkeypatch):
+        monkeypatch.setattr("app.core.services.application_service.IMPORT_MAX_ROWS", 1)
+        content = "role,company\nFirst,Acme\nSecond,Acme\n"
+
+        response = await client.post(self.url, files={"file": ("applications.csv", content)})
+
+        assert response.status_code == 413
+        assert response.json() == {"detail": "Import is limited to 1 rows"}
+
+    async def test_import_without_access_token(self, client: AsyncClient):
+        del client.headers["Authorization"]
+        response = await client.post(self.url, files={"file": ("applications.csv", "role,company\n")})
+
+        assert response.status_code == 401
+
+
+class TestApplicationExport:
+    url: str = "/applications/export"
+
+    async def test_export_csv(self, client: AsyncClient, user: User, company: Company, application_factory):
+        apps = await application_factory.batch(3, user_id=user.id, company_id=company.id, note="Line one, two")
+        await application_factory()  # another user's application
+
+        response = await client.get(self.url)
+
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("text/csv")
+        assert 'filename="applications.csv"' in response.headers["content-disposition"]
+        rows = list(csv.DictReader(io.StringIO(response.text)))
+        assert [int(row["id"]) for row in rows] == [app.id for app in apps]
+        assert {row["company"] for row in rows} == {company.name}
+        assert rows[0]["note"] == "Line one, two"
+        assert rows[0]["interview_date"] == ""
+
+    async def test_export_ndjson(self, client: AsyncClient, user: User, company: Company, application_factory):
+        app = await application_factory(user_id=user.id, company_id=company.id)
+
+        response = await client.get(self.url, params={"format": "ndjson"})
+
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("application/x-ndjson")
+        rows = [json.loads(line) for line in response.text.splitlines()]
+        assert len(rows) == 1
+        assert rows[0]["id"] == app.id
+        assert rows[0]["role"] == app.role
+        assert rows[0]["company"] == company.name
+
+    async def test_export_empty(self, client: AsyncClient):
+        response = await client.get(self.url)
+
+        assert response.status_code == 200
+        assert response.text.strip() == ",".join(ApplicationExportRow.model_fields)
+
+    async def test_export_can_be_imported(self, client: AsyncClient, user: User, application_factory):
+        await application_factory.batch(2, user_id=user.id)
+        exported = await client.get(self.url)
+
+        response = await client.post("/applications/import", files={"file": ("applications.csv", exported.content)})
+
+        assert response.status_code == 200
+        assert response.json() == {"imported": 2, "errors": []}
+
+
+class TestApplicationStats:
+    url: str = "/applications/stats"
+
+    async def test_stats(self, client: AsyncClient, user: User, application_factory):
+        now = datetime.now(UTC)
+        week_start = (now - timedelta(days=now.weekday())).date()
+        await application_factory.batch(2, user_id=user.id, status=AppStatus.INTERVIEW, time_create=now)
+        await application_factory(
+            user_id=user.id, work_location=WorkLocation.REMOTE, time_create=now - timedelta(weeks=1)
+        )
+        await application_factory(user_id=user.id, time_create=now - timedelta(weeks=20))
+        await application_factory()  # another user's application
+
+        response = await client.get(self.url, params={"weeks": 3})
+
+        assert response.status_code == 200
+        stats = response.json()
+        assert stats["total"] == 4
+        assert stats["by_status"] == {"applied": 2, "interview": 2, "offer": 0, "rejected": 0}
+        assert stats["by_work_type"]["full_time"] == 4
+        assert sum(stats["by_work_type"].values()) == 4
+        assert stats["by_work_location"] == {"on_site": 3, "remote": 1, "hybrid": 0}
+        assert stats["weekly"] == [
+            {"week_start": str(week_start - timedelta(weeks=2)), "count": 0},
+            {"week_start": str(week_start - timedelta(weeks=1)), "count": 1},
+            {"week_start": str(week_start), "count": 2},
+        ]
+
+    async def test_stats_empty(self, client: AsyncClient):
+        response = await client.get(self.url)
+
+        assert response.status_code == 200
+        stats = response.json()
+        assert stats["total"] == 0
+        assert set(stats["by_status"].values()) == {0}
+        assert len(stats["weekly"]) == 12
+        assert all(week["count"] == 0 for week in stats["weekly"])
+
+    async def test_stats_invalid_weeks(self, client: AsyncClient):
+        response = await client.get(self.url, params={"weeks": 0})
+
+        assert response.status_code == 422
+
+    async def test_stats_uses_read_session(self, client: AsyncClient, forbid_primary_session):
+        response = await client.get(self.url)
+
+        assert response.status_code == 200
+
+    async def test_stats_without_access_token(self, client: AsyncClient):
+        del client.headers["Authorization"]
+
+        response = await client.get(self.url)
+
+        assert response.status_code == 401
+
+
 class TestApplicationCreate:
     url: str = "/applications"
 
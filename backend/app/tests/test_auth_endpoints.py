@@ -8,6 +8,7 @@ from app import ACCESS_TOKEN_EXPIRE_MINUTES, REFRESH_TOKEN_EXPIRE_MINUTES
 from app.core.exceptions.generic import InvalidPasswordError
 from app.core.exceptions.user import UserNotActivatedError, UserNotFoundError
 from app.core.services.auth_service import AuthService
+from app.infrastructure.security import Argon2Profile, PwdlibHasher
 
 
 class TestLoginEndpoint:
@@ -98,6 +99,27 @@ class TestLoginEndpoint:
         response = await client.post(self.url)
         assert response.status_code == 422
 
+    async def test_outdated_hash_upgraded(self, client: AsyncClient, user_factory, user_repo, session):
+        password = "TestPass123"
+        user = await user_factory(password=password)
+        assert user.id is not None
+        weak_hasher = PwdlibHasher(profile=Argon2Profile(time_cost=1, memory_cost=8192, parallelism=1))
+        await user_repo.update(user.id, password=weak_hasher.hash(password))
+        await session.commit()
+
+        response = await client.post(
+            self.url,
+            data={"username": user.email, "password": password},
+            headers={"Content-Type": "application/x-www-form-urlencoded"},
+        )
+
+        assert response.status_code == 200
+        updated_user = await user_repo.get_by_id(user.id)
+        assert updated_user is not None and updated_user.password is not None
+        assert "m=8192" not in updated_user.password
+        current_hasher = PwdlibHasher()
+        assert current_hasher.verify_and_update(password, updated_user.password) == (True, None)
+
     async def test_inactive_user(self, client: AsyncClient, mocker, user_factory):
         password = "TestPass123"
         user = await user_factory(is_active=False, password=password)
@@ -283,3 +305,48 @@ class TestRefreshEndpoint:
         # Expect 401 because the token was cascade-deleted with the user
         assert response.status_code == 401
         assert response.json()["detail"] == "Token is not valid"
+
+
+class TestSessionsEndpoint:
+    url: str = "/auth/sessions"
+
+    async def test_list_sessions(self, client: AsyncClient, user_factory, access_token_factory, refresh_token_factory):
+        user = await user_factory()
+        access_token = access_token_factory(user)
+        first = await refresh_token_factory(user)
+        second = await refresh_token_factory(user)
+        await refresh_token_factory(await user_factory())  # another user's session
+
+        response = await client.get(
+            self.url,
+            headers={"Authorization": f"Bearer {access_token.token}"},
+            cookies={"refresh": first.token},
+        )
+
+        assert response.status_code == 200
+        sessions = response.json()
+        assert len(sessions) == 2
+        assert [session["current"] for session in sessions] == [False, True]
+        assert second.token not in response.text
+
+    async def test_rotated_session_listed_once(
+        self, client: AsyncClient, user_factory, access_token_factory, refresh_token_factory
+    ):
+        user = await user_factory()
+        access_token = access_token_factory(user)
+        refresh_token = await refresh_token_factory(user)
+        refreshed = await client.post("/auth/refresh", cookies={"refresh": refresh_token.token})
+
+        response = await client.get(
+            self.url,
+            headers={"Authorization": f"Bearer {access_token.token}"},
+            cookies={"refresh": refreshed.cookies["refresh"]},
+        )
+
+        assert response.status_code == 200
+        assert [session["current"] for session in response.json()] == [True]
+
+    async def test_without_access_token(self, client: AsyncClient):
+        response = await client.get(self.url)
+
+        assert response.status_code == 401
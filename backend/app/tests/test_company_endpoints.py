@@ -1,3 +1,4 @@
+import pytest
 from httpx import AsyncClient
 
 
@@ -16,6 +17,13 @@ class TestCompanyGetById:
         assert data["id"] == company.id
         assert data["name"] == company.name
 
+    async def test_uses_read_session(self, client: AsyncClient, company_factory, forbid_primary_session):
+        company = await company_factory()
+
+        response = await client.get(self.url.format(id=company.id))
+
+        assert response.status_code == 200
+
     async def test_get_company_not_found(self, client: AsyncClient):
         """Should return 404 for non-existent company id."""
         response = await client.get(self.url.format(id=999999))
@@ -140,3 +148,64 @@ class TestGetUserCompanies:
         data = response.json()
         # Sorted names would be [A, B, C, D] -> slice [1:3] => [B, C]
         assert [c["name"] for c in data] == ["B", "C"]
+
+
+class TestCompanyAutocomplete:
+    url: str = "/companies/autocomplete"
+
+    @pytest.fixture(name="headers")
+    async def auth_headers(self, user_factory, access_token_factory):
+        user = await user_factory()
+        return {"Authorization": f"Bearer {access_token_factory(user).token}"}
+
+    async def test_prefix_match(self, client: AsyncClient, headers, company_factory):
+        for name in ["Google Cloud", "google", "Goldman Sachs", "Alphabet"]:
+            await company_factory(name=name)
+
+        response = await client.get(self.url, params={"prefix": "GOO"}, headers=headers)
+
+        assert response.status_code == 200
+        assert [c["name"] for c in response.json()] == ["google", "Google Cloud"]
+
+    async def test_limit(self, client: AsyncClient, headers, company_factory):
+        for name in ["Acme A", "Acme B", "Acme C"]:
+            await company_factory(name=name)
+
+        response = await client.get(self.url, params={"prefix": "acme", "limit": 2}, headers=headers)
+
+        assert [c["name"] for c in response.json()] == ["Acme A", "Acme B"]
+
+    async def test_pattern_characters_are_literal(self, client: AsyncClient, headers, company_factory):
+        await company_factory(name="100% Remote")
+        await company_factory(name="1000 Startups")
+
+        response = await client.get(self.url, params={"prefix": "100%"}, headers=headers)
+
+        assert [c["name"] for c in response.json()] == ["100% Remote"]
+
+    async def test_underscore_is_literal(self, client: AsyncClient, headers, company_factory):
+        await company_factory(name="a_b Labs")
+        await company_factory(name="axb Labs")
+
+        response = await client.get(self.url, params={"prefix": "A_B"}, headers=headers)
+
+        assert [c["name"] for c in response.json()] == ["a_b Labs"]
+
+    async def test_results_are_cached(self, client: AsyncClient, headers, company_factory):
+        await company_factory(name="Cached First")
+        await client.get(self.url, params={"prefix": "cached"}, headers=headers)
+        await company_factory(name="Cached Second")
+
+        response = await client.get(self.url, params={"prefix": "Cached"}, headers=headers)
+
+        assert [c["name"] for c in response.json()] == ["Cached First"]
+
+    async def test_empty_prefix(self, client: AsyncClient, headers):
+        response = await client.get(self.url, params={"prefix": ""}, headers=headers)
+
+        assert response.status_code == 422
+
+    async def test_without_access_token(self, client: AsyncClient):
+        response = await client.get(self.url, params={"prefix": "a"})
+
+        assert response.status_code == 401
@@ -1,8 +1,27 @@
+import asyncio
+import threading
+from datetime import UTC, datetime, timedelta
+
 import pytest
+from freezegun import freeze_time
+from sqlalchemy import NullPool, func, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.db.models import Company as CompanyModel
-from app.infrastructure.repositories import CompanySQLAlchemyRepository
+from app.core.dto import AccessTokenPayload, ApplicationFilterParams
+from app.db.config import get_engine_options, get_replica_url, url_object
+from app.db.models import Company as CompanyModel, User as UserModel
+from app.infrastructure.repositories import CompanySQLAlchemyRepository, UserSQLAlchemyRepository
+from app.infrastructure.repositories.slq_alchemy.company import company_cache
+from app.infrastructure.repositories.slq_alchemy.user import UserCache
+from app.infrastructure.security import (
+    Argon2Profile,
+    InMemoryAccessTokenDenyList,
+    PasswordHashingPool,
+    PwdlibHasher,
+    TransactionalAccessTokenDenyList,
+    get_argon2_profile,
+)
+from app.utils import TTLCache
 
 
 @pytest.fixture(name="repo")
@@ -29,3 +48,324 @@ class TestCompanySQLAlchemyRepository:
         companies = await repo.get_companies(**params)
 
         assert len(companies) == res
+
+    async def test_get_or_create(self, repo: CompanySQLAlchemyRepository, session: AsyncSession, company_factory):
+        existing = await company_factory(name="Existing")
+
+        found = await repo.get_or_create("Existing")
+        created = await repo.get_or_create("Created")
+
+        assert found == existing
+        assert created.id is not None and created.name == "Created"
+        count = await session.scalar(
+            select(func.count()).select_from(CompanyModel).where(CompanyModel.name.in_(["Existing", "Created"]))
+        )
+        assert count == 2
+
+    async def test_get_or_create_many(self, repo: CompanySQLAlchemyRepository, company_factory):
+        existing = await company_factory(name="Existing")
+
+        company_ids = await repo.get_or_create_many(["Existing", "Created", "Created"])
+
+        assert company_ids.keys() == {"Existing", "Created"}
+        assert company_ids["Existing"] == existing.id
+        created = await repo.get_by_name("Created")
+        assert created is not None and created.id == company_ids["Created"]
+
+
+class TestApplicationSQLAlchemyRepository:
+    @pytest.fixture(name="other_user_application")
+    async def create_other_user_application(self, user_factory, company_factory, application_factory):
+        user = await user_factory()
+        other = await user_factory()
+        company = await company_factory(name="Shared")
+        own = await application_factory(user_id=user.id, company_id=company.id, role="Backend Developer")
+        foreign = await application_factory(user_id=other.id, company_id=company.id, role="Backend Developer")
+        return user, own, foreign
+
+    @pytest.mark.parametrize(
+        "params", [{}, {"company_name": "Shared", "role_name": "Backend"}, {"order_direction": "asc", "limit": 10}]
+    )
+    async def test_list_and_count_scoped_to_user(self, params, application_repo, other_user_application):
+        user, own, _ = other_user_application
+        filter_param = ApplicationFilterParams(**params)
+
+        applications = await application_repo.get_by_user_id(user.id, filter_param)
+        total = await application_repo.count_by_user_id(user.id, filter_param)
+
+        assert [application.id for application in applications] == [own.id]
+        assert total == 1
+
+    async def test_other_queries_scoped_to_user(self, application_repo, other_user_application):
+        user, own, foreign = other_user_application
+
+        counts = await application_repo.get_counts(user.id)
+        found = await application_repo.search(user.id, "Shared", limit=10)
+        streamed = [application async for application in application_repo.stream_by_user_id(user.id)]
+
+        assert sum(counts.by_status.values()) == 1
+        assert [application.id for application in found] == [own.id]
+        assert [application.id for application in streamed] == [own.id]
+        assert await application_repo.get_by_id(foreign.id, user_id=user.id) is None
+
+
+class TestTTLCache:
+    def test_disabled(self):
+        cache: TTLCache[int, str] = TTLCache(max_size=10, ttl_seconds=0)
+        cache.set(1, "one")
+
+        assert cache.get(1) is None
+        assert cache.stats()["size"] == 0
+        assert cache.stats()["misses"] == 0
+
+    def test_lru_eviction(self):
+        cache: TTLCache[int, str] = TTLCache(max_size=2, ttl_seconds=60)
+        cache.set(1, "one")
+        cache.set(2, "two")
+        assert cache.get(1) == "one"
+        cache.set(3, "three")
+
+        assert cache.get(2) is None
+        assert cache.get(1) == "one"
+        assert cache.get(3) == "three"
+        assert cache.stats() == {"size": 2, "max_size": 2, "ttl_seconds": 60, "hits": 3, "misses": 1}
+
+    def test_expiry(self):
+        cache: TTLCache[int, str] = TTLCache(max_size=10, ttl_seconds=60)
+        with freeze_time("2025-01-01 00:00:00") as frozen:
+            cache.set(1, "one")
+            frozen.tick(59)
+            assert cache.get(1) == "one"
+            frozen.tick(2)
+            assert cache.get(1) is None
+        assert cache.stats()["size"] == 0
+
+
+class TestUserCache:
+    @pytest.fixture(name="cache")
+    def enabled_user_cache(self, monkeypatch):
+        cache = UserCache(max_size=10, ttl_seconds=60)
+        monkeypatch.setattr("app.infrastructure.repositories.slq_alchemy.user.user_cache", cache)
+        return cache
+
+    async def test_get_by_email_cached(self, cache: UserCache, user_factory, session: AsyncSession):
+        user = await user_factory()
+        repo = UserSQLAlchemyRepository(session)
+
+        first = await repo.get_by_email(user.email)
+        await session.execute(update(UserModel).where(UserModel.id == user.id).values(first_name="Changed"))
+        second = await repo.get_by_email(user.email)
+        by_id = await repo.get_by_id(user.id)
+
+        assert first == second == by_id
+        assert second is not None and second.first_name != "Changed"
+        assert cache.stats()["hits"] == 2
+        assert cache.stats()["misses"] == 1
+
+    async def test_email_misses_counted(self, cache: UserCache, user_factory, session: AsyncSession):
+        user = await user_factory()
+        repo = UserSQLAlchemyRepository(session)
+
+        await repo.get_by_email(user.email)
+        await repo.get_by_email("missing@example.com")
+
+        assert cache.stats()["hits"] == 0
+        assert cache.stats()["misses"] == 2
+
+    async def test_update_invalidates(self, cache: UserCache, user_factory, session: AsyncSession):
+        user = await user_factory()
+        repo = UserSQLAlchemyRepository(session)
+        await repo.get_by_id(user.id)
+
+        await repo.update(user.id, is_active=False)
+        await session.commit()
+        refreshed = await repo.get_by_email(user.email)
+
+        assert refreshed is not None
+        assert refreshed.is_active is False
+
+    async def test_delete_invalidates(self, cache: UserCache, user_factory, session: AsyncSession):
+        user = await user_factory()
+        repo = UserSQLAlchemyRepository(session)
+        await repo.get_by_email(user.email)
+
+        await repo.delete(user.id)
+        await session.commit()
+
+        assert await repo.get_by_email(user.email) is None
+        assert await repo.get_by_id(user.id) is None
+
+    async def test_uncommitted_write_not_cached(self, cache: UserCache, user_factory, session: AsyncSession):
+        user = await user_factory()
+        repo = UserSQLAlchemyRepository(session)
+
+        await repo.update(user.id, first_name="Pending")
+        await repo.get_by_id(user.id)
+        await session.rollback()
+
+        assert cache.get_by_id(user.id) is None
+
+
+class TestPasswordHashingPool:
+    async def test_runs_off_event_loop_thread(self):
+        pool = PasswordHashingPool(max_workers=1)
+
+        thread_name = await pool.run(lambda: threading.current_thread().name)
+
+        assert thread_name.startswith("password-hash")
+        assert pool.stats()["completed"] == 1
+
+    async def test_hasher_async_roundtrip(self):
+        pool = PasswordHashingPool(max_workers=2)
+        hasher = PwdlibHasher(pool=pool)
+
+        hashes = await asyncio.gather(*(hasher.hash_async(f"Password{i}") for i in range(3)))
+
+        assert await hasher.verify_async("Password0", hashes[0])
+        assert not await hasher.verify_async("Password1", hashes[0])
+        stats = pool.stats()
+        assert stats["completed"] == 5
+        assert stats["queued"] == 0
+        assert stats["running"] == 0
+
+
+class TestArgon2Profiles:
+    def test_override_parameter(self):
+        profile = get_argon2_profile("lambda-512", time_cost=4, memory_cost=None, parallelism=None)
+
+        assert profile == Argon2Profile(time_cost=4, memory_cost=19456, parallelism=1)
+
+    def test_unknown_profile(self):
+        with pytest.raises(ValueError, match="Unknown password hash profile"):
+            get_argon2_profile("lambda-128")
+
+    def test_verify_and_update_rehashes_other_profile(self):
+        old_hasher = PwdlibHasher(profile=Argon2Profile(time_cost=1, memory_cost=8192, parallelism=1))
+        new_hasher = PwdlibHasher(profile=Argon2Profile(time_cost=2, memory_cost=8192, parallelism=1))
+        old_hash = old_hasher.hash("Password1")
+
+        assert new_hasher.verify_and_update("Wrong1", old_hash) == (False, None)
+        is_valid, updated_hash = new_hasher.verify_and_update("Password1", old_hash)
+        assert is_valid
+        assert updated_hash is not None
+        assert new_hasher.verify_and_update("Password1", updated_hash) == (True, None)
+
+
+class TestEngineOptions:
+    def test_preset_with_overrides(self):
+        options = get_engine_options("lambda", pool_size=2, pool_pre_ping=False, statement_cache_size=0)
+
+        assert options == {
+            "pool_size": 2,
+            "max_overflow": 1,
+            "pool_timeout": 10,
+            "pool_recycle": 300,
+            "pool_pre_ping": False,
+            "connect_args": {"statement_cache_size": 0},
+        }
+
+    def test_null_pool_ignores_sizing(self):
+        options = get_engine_options("null", pool_size=5, max_overflow=5)
+
+        assert options == {"poolclass": NullPool}
+
+    def test_unknown_preset(self):
+        with pytest.raises(ValueError, match="Unknown database pool preset"):
+            get_engine_options("tiny")
+
+
+class TestReplicaUrl:
+    def test_not_configured(self):
+        assert get_replica_url(None) is None
+        assert get_replica_url("") is None
+
+    def test_shares_primary_credentials(self):
+        replica_url = get_replica_url("replica.internal", 6432)
+
+        assert replica_url is not None
+        assert (replica_url.host, replica_url.port) == ("replica.internal", 6432)
+        assert replica_url.username == url_object.username
+        assert replica_url.database == url_object.database
+        assert get_replica_url("replica.internal").port == url_object.port
+
+
+class TestCompanyCache:
+    async def test_created_company_cached_after_commit(
+        self, repo: CompanySQLAlchemyRepository, session: AsyncSession, mocker
+    ):
+        company = await repo.get_or_create("Cached Corp")
+        assert company_cache.get_by_name("Cached Corp") is None
+
+        await session.commit()
+        scalar_spy = mocker.spy(session, "scalar")
+
+        assert await repo.get_or_create("Cached Corp") == company
+        assert await repo.get_by_name("Cached Corp") == company
+        assert await repo.get_by_id(company.id) == company
+        scalar_spy.assert_not_called()
+        assert company_cache.stats()["by_name"]["hits"] == 2
+
+    async def test_rolled_back_company_not_cached(self, repo: CompanySQLAlchemyRepository, session: AsyncSession):
+        company = await repo.get_or_create("Rolled Back Corp")
+        assert await repo.get_by_name("Rolled Back Corp") == company
+
+        await session.rollback()
+
+        assert company_cache.get_by_name("Rolled Back Corp") is None
+        assert company_cache.get_by_id(company.id) is None
+
+    async def test_get_by_ids_mixes_cache_and_database(self, repo: CompanySQLAlchemyRepository, company_factory):
+        first, second = await company_factory(), await company_factory()
+        await repo.get_by_id(first.id)
+
+        companies = await repo.get_by_ids([first.id, second.id])
+
+        assert sorted(companies, key=lambda c: c.id) == [first, second]
+        assert company_cache.stats()["by_id"]["hits"] == 1
+
+
+class TestAccessTokenDenyList:
+    def _payload(self, user_id: int, iat: datetime) -> AccessTokenPayload:
+        return AccessTokenPayload(user_email="user@example.com", user_id=user_id, is_active=True, iat=iat)
+
+    def test_token_issued_in_denial_second_denied(self):
+        deny_list = InMemoryAccessTokenDenyList()
+
+        with freeze_time("2026-01-01 12:00:00.900000+00:00"):
+            deny_list.deny_user(1)
+
+        assert deny_list.is_denied(self._payload(1, datetime(2026, 1, 1, 12, 0, 0, tzinfo=UTC)))
+        assert not deny_list.is_denied(self._payload(1, datetime(2026, 1, 1, 12, 0, 1, tzinfo=UTC)))
+        assert not deny_list.is_denied(self._payload(2, datetime(2026, 1, 1, 11, 59, 59, tzinfo=UTC)))
+
+    async def test_denial_applied_on_commit(self, session: AsyncSession):
+        deny_list = InMemoryAccessTokenDenyList()
+        payload = self._payload(1, datetime.now(UTC) - timedelta(minutes=1))
+
+        TransactionalAccessTokenDenyList(session, deny_list).deny_user(1)
+        assert not deny_list.is_denied(payload)
+        await session.commit()
+
+        assert deny_list.is_denied(payload)
+
+    async def test_denial_discarded_on_rollback(self, session: AsyncSession):
+        deny_list = InMemoryAccessTokenDenyList()
+        payload = self._payload(1, datetime.now(UTC) - timedelta(minutes=1))
+
+        TransactionalAccessTokenDenyList(session, deny_list).deny_user(1)
+        await session.rollback()
+        await session.commit()
+
+        assert not deny_list.is_denied(payload)
+
+    async def test_denial_waits_for_outer_commit(self, session: AsyncSession):
+        deny_list = InMemoryAccessTokenDenyList()
+        payload = self._payload(1, datetime.now(UTC) - timedelta(minutes=1))
+
+        TransactionalAccessTokenDenyList(session, deny_list).deny_user(1)
+        async with session.begin_nested():
+            pass
+        assert not deny_list.is_denied(payload)
+        await session.rollback()
+
+        assert not deny_list.is_denied(payload)
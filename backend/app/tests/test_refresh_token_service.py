@@ -2,6 +2,7 @@
 
 import hashlib
 import hmac
+import logging
 import secrets
 from datetime import datetime, timedelta, timezone
 
@@ -169,6 +170,71 @@ class TestRefreshTokenService:
         assert token2_obj.is_revoked()
         assert token1_obj.family_id == token2_obj.family_id
 
+    async def test_rotate_only_once(self, user_factory, refresh_token_repo):
+        """Test that a token can be rotated by only one of two racing refreshes."""
+        user = await user_factory()
+        service = RefreshTokenService(refresh_token_repo)
+        token_hash = self._hash_token(await service.issue(user.id))
+        expires_at = datetime.now(timezone.utc) + timedelta(minutes=10)
+
+        first = await refresh_token_repo.rotate(token_hash, self._hash_token("first"), expires_at)
+        second = await refresh_token_repo.rotate(token_hash, self._hash_token("second"), expires_at)
+
+        parent = await refresh_token_repo.get_by_hash(token_hash)
+        assert first is not None
+        assert first.parent_token_id == parent.id
+        assert first.family_id == parent.family_id
+        assert second is None
+        assert await refresh_token_repo.get_by_hash(self._hash_token("second")) is None
+
+    async def test_validate_and_rotate_wrong_user_keeps_token_unused(self, user_factory, refresh_token_repo):
+        """Test that a failed ownership check does not consume the token."""
+        user1 = await user_factory()
+        user2 = await user_factory(email="another@example.com")
+        service = RefreshTokenService(refresh_token_repo)
+        token = await service.issue(user1.id)
+
+        with pytest.raises(TokenInvalidError):
+            await service.validate_and_rotate(token, user2.id)
+
+        token_obj = await refresh_token_repo.get_by_hash(self._hash_token(token))
+        assert token_obj.is_valid()
+
+    async def test_delete_stale(self, user_factory, refresh_token_repo):
+        """Test purging expired and revoked tokens in batches while keeping live ones."""
+        user = await user_factory()
+        service = RefreshTokenService(refresh_token_repo)
+        now = datetime.now(timezone.utc)
+        live = await service.issue(user.id)
+        for _ in range(2):
+            await service.issue(user.id, expires_at=now - timedelta(days=2))
+        revoked = await service.issue(user.id)
+        await service.revoke(revoked)
+
+        with freeze_time(now + timedelta(minutes=1)):
+            assert await refresh_token_repo.delete_stale(datetime.now(timezone.utc), limit=2) == 2
+            assert await refresh_token_repo.delete_stale(datetime.now(timezone.utc), limit=2) == 1
+
+        assert await refresh_token_repo.get_by_hash(self._hash_token(live)) is not None
+        assert await refresh_token_repo.get_by_hash(self._hash_token(revoked)) is None
+
+    async def test_issue_evicts_least_recently_refreshed_session(self, user_factory, refresh_token_repo):
+        """Test that a new login beyond the cap revokes the session refreshed longest ago."""
+        user = await user_factory()
+        service = RefreshTokenService(refresh_token_repo, max_active_sessions=2)
+        first = await service.issue(user.id)
+        second = await service.issue(user.id)
+        first, _ = await service.validate_and_rotate(first, user.id)
+
+        third = await service.issue(user.id)
+
+        with pytest.raises(RefreshTokenRevokedError):
+            await service.validate_and_rotate(second, user.id)
+        sessions = await service.list_sessions(user.id, third)
+        assert len(sessions) == 2
+        assert [session.current for session in sessions] == [True, False]
+        assert (await refresh_token_repo.get_by_hash(self._hash_token(first))).is_valid()
+
     async def test_revoke_single_token(self, user_factory, refresh_token_repo):
         """Test revoking a single token."""
         user = await user_factory()
@@ -200,6 +266,38 @@ class TestRefreshTokenService:
             token_obj = await refresh_token_repo.get_by_hash(token_hash)
             assert token_obj.is_revoked()
 
+    async def test_revoke_all_skips_revoked_and_expired_tokens(self, user_factory, refresh_token_repo, caplog):
+        """Test that bulk revocation only rewrites live tokens and reports how many it revoked."""
+        user = await user_factory()
+        service = RefreshTokenService(refresh_token_repo)
+        await service.issue(user.id)
+        await service.issue(user.id)
+        revoked = await service.issue(user.id)
+        await service.revoke(revoked)
+        revoked_at = (await refresh_token_repo.get_by_hash(self._hash_token(revoked))).revoked_at
+        expired = await service.issue(user.id, expires_at=datetime.now(timezone.utc) - timedelta(minutes=1))
+
+        service_logger = "app.core.services.refresh_token_service"
+        with caplog.at_level(logging.INFO, logger=service_logger):
+            assert await service.revoke_all_for_user(user.id) == 2
+        assert [record.getMessage() for record in caplog.records if record.name == service_logger] == [
+            f"Revoked 2 live refresh tokens of user {user.id}"
+        ]
+        assert (await refresh_token_repo.get_by_hash(self._hash_token(revoked))).revoked_at == revoked_at
+        assert not (await refresh_token_repo.get_by_hash(self._hash_token(expired))).is_revoked()
+        assert await service.revoke_all_for_user(user.id) == 0
+
+    async def test_revoke_token_family_counts_live_tokens(self, user_factory, refresh_token_repo):
+        """Test that revoking a family reports only the tokens it actually revoked."""
+        user = await user_factory()
+        service = RefreshTokenService(refresh_token_repo)
+        token1 = await service.issue(user.id)
+        await service.validate_and_rotate(token1, user.id)
+        family_id = (await refresh_token_repo.get_by_hash(self._hash_token(token1))).family_id
+
+        assert await refresh_token_repo.revoke_token_family(family_id) == 2
+        assert await refresh_token_repo.revoke_token_family(family_id) == 0
+
     async def test_revoke_all_does_not_affect_other_users(self, user_factory, refresh_token_repo):
         """Test that revoking all tokens for one user doesn't affect others."""
         user1 = await user_factory()
@@ -836,6 +836,44 @@ class TestResendActivationEmail:
         assert "seconds before requesting another activation email" in response.json()["detail"]
         assert not mock_send_verification.called
 
+    @patch("app.core.services.user_email_service.UserEmailService.send_verification_email")
+    async def test_resend_activation_rate_limited_keeps_previous_token(
+        self,
+        mock_send_verification: MagicMock,
+        client: AsyncClient,
+        inactive_user: User,
+        verification_token_strategy: VerificationTokenService,
+    ):
+        """Test a throttled resend writes nothing, so the previously emailed token still activates."""
+        assert inactive_user.id is not None
+        old_token = await verification_token_strategy.issue(user_id=inactive_user.id)
+
+        response = await client.post(self.url, data={"email": inactive_user.email})
+
+        assert response.status_code == 429
+        assert (await client.patch("/users/activate", params={"token": old_token})).status_code == 200
+
+    @patch("app.core.services.user_email_service.UserEmailService.send_verification_email")
+    async def test_resend_activation_replaces_previous_token(
+        self,
+        mock_send_verification: MagicMock,
+        client: AsyncClient,
+        inactive_user: User,
+        verification_token_strategy: VerificationTokenService,
+    ):
+        """Test resend activation replaces the previous token so only the emailed one activates."""
+        assert inactive_user.id is not None
+        old_token = await verification_token_strategy.issue(user_id=inactive_user.id)
+
+        with freeze_time(datetime.now(timezone.utc) + timedelta(minutes=3)):
+            response = await client.post(self.url, data={"email": inactive_user.email})
+
+        assert response.status_code == 200
+        _, new_token = mock_send_verification.call_args.args
+        assert new_token != old_token
+        assert (await client.patch("/users/activate", params={"token": old_token})).status_code == 400
+        assert (await client.patch("/users/activate", params={"token": new_token})).status_code == 200
+
     @patch("app.core.services.user_email_service.UserEmailService.send_verification_email")
     async def test_resend_activation_no_previous_token(
         self, mock_send_verification: MagicMock, client: AsyncClient, inactive_user: User
@@ -1,3 +1,10 @@
 """Utility modules for the application."""
 
+from .application_io import (
+    EXPORT_MEDIA_TYPES as EXPORT_MEDIA_TYPES,
+    guess_file_format as guess_file_format,
+    iter_export as iter_export,
+    iter_import_rows as iter_import_rows,
+)
+from .cache import TTLCache as TTLCache
 from .template_loader import TemplateLoader as TemplateLoader
@@ -0,0 +1,94 @@
+"""Reading application import files and writing exports."""
+
+import csv
+import io
+from collections.abc import AsyncIterable, AsyncIterator, Iterator
+from pathlib import PurePath
+from typing import IO, Any
+
+from app.core.dto import ApplicationExportRow, ApplicationFileFormat
+
+type ImportRow = tuple[int, dict[str, Any] | str]
+
+
+def iter_csv_rows(file: IO[bytes]) -> Iterator[ImportRow]:
+    """Yield ``(line number, row)`` pairs from a CSV file with a header row.
+
+    Empty cells are dropped so that the import model applies its defaults to them.
+    """
+    text = io.TextIOWrapper(file, encoding="utf-8-sig", newline="")
+    try:
+        reader = csv.DictReader(text)
+        for row in reader:
+            yield reader.line_num, {key: value for key, value in row.items() if key is not None and value}
+    finally:
+        # Leave the underlying upload open for its owner to close
+        text.detach()
+
+
+def iter_ndjson_rows(file: IO[bytes]) -> Iterator[ImportRow]:
+    """Yield ``(line number, raw JSON line)`` pairs, skipping blank lines."""
+    text = io.TextIOWrapper(file, encoding="utf-8-sig")
+    try:
+        for line_number, line in enumerate(text, start=1):
+            if line.strip():
+                yield line_number, line
+    finally:
+        text.detach()
+
+
+FILE_SUFFIXES = {
+    ".csv": ApplicationFileFormat.csv,
+    ".ndjson": ApplicationFileFormat.ndjson,
+    ".jsonl": ApplicationFileFormat.ndjson,
+}
+
+
+def guess_file_format(filename: str | None) -> ApplicationFileFormat | None:
+    return FILE_SUFFIXES.get(PurePath(filename).suffix.lower()) if filename else None
+
+
+def iter_import_rows(file: IO[bytes], file_format: ApplicationFileFormat) -> Iterator[ImportRow]:
+    if file_format is ApplicationFileFormat.csv:
+        return iter_csv_rows(file)
+    return iter_ndjson_rows(file)
+
+
+EXPORT_MEDIA_TYPES = {
+    ApplicationFileFormat.csv: "text/csv",
+    ApplicationFileFormat.ndjson: "application/x-ndjson",
+}
+
+
+async def iter_csv_export(rows: AsyncIterable[ApplicationExportRow], chunk_rows: int = 100) -> AsyncIterator[str]:
+    """Render rows as CSV with a header, yielding chunks of ``chunk_rows`` rows."""
+    buffer = io.StringIO()
+    writer = csv.DictWriter(buffer, fieldnames=list(ApplicationExportRow.model_fields))
+    writer.writeheader()
+    written = 0
+    async for row in rows:
+        writer.writerow(row.model_dump(mode="json"))
+        written += 1
+        if written % chunk_rows == 0:
+            yield buffer.getvalue()
+            buffer.seek(0)
+            buffer.truncate()
+    yield buffer.getvalue()
+
+
+async def iter_ndjson_export(rows: AsyncIterable[ApplicationExportRow], chunk_rows: int = 100) -> AsyncIterator[str]:
+    """Render rows as one JSON object per line, yielding chunks of ``chunk_rows`` rows."""
+    lines: list[str] = []
+    async for row in rows:
+        lines.append(row.model_dump_json() + "\n")
+        if len(lines) == chunk_rows:
+            yield "".join(lines)
+            lines = []
+    if lines:
+        yield "".join(lines)
+
+
+def iter_export(rows: AsyncIterable[ApplicationExportRow], file_format: ApplicationFileFormat) -> AsyncIterator[str]:
+    if file_format is ApplicationFileFormat.csv:
+        return iter_csv_export(rows)
+    return iter_ndjson_export(rows)
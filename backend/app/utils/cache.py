@@ -0,0 +1,77 @@
+"""In-process caching utilities."""
+
+from __future__ import annotations
+
+import time
+from collections import OrderedDict
+from typing import TypedDict
+
+
+class CacheStats(TypedDict):
+    size: int
+    max_size: int
+    ttl_seconds: float
+    hits: int
+    misses: int
+
+
+class TTLCache[K, V]:
+    """Bounded in-process LRU cache whose entries also expire after ``ttl_seconds``.
+
+    A cache with a non-positive ``ttl_seconds`` or ``max_size`` is disabled: lookups always
+    miss without being counted and writes are ignored. The cache is not shared between
+    processes, so it must only hold data whose staleness is bounded by the TTL.
+    """
+
+    def __init__(self, max_size: int, ttl_seconds: float) -> None:
+        self.max_size = max_size
+        self.ttl_seconds = ttl_seconds
+        self.hits = 0
+        self.misses = 0
+        self._entries: OrderedDict[K, tuple[float, V]] = OrderedDict()
+
+    @property
+    def enabled(self) -> bool:
+        return self.max_size > 0 and self.ttl_seconds > 0
+
+    def get(self, key: K) -> V | None:
+        if not self.enabled:
+            return None
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+        expires_at, value = entry
+        if expires_at <= time.monotonic():
+            del self._entries[key]
+            self.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return value
+
+    def set(self, key: K, value: V) -> None:
+        if not self.enabled:
+            return
+        self._entries[key] = (time.monotonic() + self.ttl_seconds, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+
+    def pop(self, key: K) -> V | None:
+        entry = self._entries.pop(key, None)
+        return entry[1] if entry else None
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self.hits = 0
+        self.misses = 0
+
+    def stats(self) -> CacheStats:
+        return CacheStats(
+            size=len(self._entries),
+            max_size=self.max_size,
+            ttl_seconds=self.ttl_seconds,
+            hits=self.hits,
+            misses=self.misses,
+        )
@@ -0,0 +1,35 @@
+"""Add refresh token live session index
+
+Revision ID: 3f9e6b1d2a74
+Revises: c5d2a8e41f07
+Create Date: 2026-10-18 16:41:09.527361
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "3f9e6b1d2a74"
+down_revision: Union[str, Sequence[str], None] = "c5d2a8e41f07"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index(
+        "ix_refresh_token_user_id_revoked_at_expires_at",
+        "refresh_token",
+        ["user_id", "revoked_at", "expires_at"],
+        unique=False,
+    )
+    # The new index leads with user_id, so the single-column one only costs writes
+    op.drop_index(op.f("ix_refresh_token_user_id"), table_name="refresh_token")
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.create_index(op.f("ix_refresh_token_user_id"), "refresh_token", ["user_id"], unique=False)
+    op.drop_index("ix_refresh_token_user_id_revoked_at_expires_at", table_name="refresh_token")
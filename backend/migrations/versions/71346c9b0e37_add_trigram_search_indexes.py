@@ -0,0 +1,44 @@
+"""Add trigram search indexes
+
+Revision ID: 71346c9b0e37
+Revises: 887362b89b68
+Create Date: 2026-10-18 10:03:17.284519
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "71346c9b0e37"
+down_revision: Union[str, Sequence[str], None] = "887362b89b68"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    op.create_index(
+        "ix_application_role_trgm",
+        "application",
+        ["role"],
+        unique=False,
+        postgresql_using="gin",
+        postgresql_ops={"role": "gin_trgm_ops"},
+    )
+    op.create_index(
+        "ix_company_name_trgm",
+        "company",
+        ["name"],
+        unique=False,
+        postgresql_using="gin",
+        postgresql_ops={"name": "gin_trgm_ops"},
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("ix_company_name_trgm", table_name="company", postgresql_using="gin")
+    op.drop_index("ix_application_role_trgm", table_name="application", postgresql_using="gin")
@@ -0,0 +1,40 @@
+"""Add application user listing indexes
+
+Revision ID: 887362b89b68
+Revises: be1c4ed95eaf
+Create Date: 2026-10-18 09:12:41.503118
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "887362b89b68"
+down_revision: Union[str, Sequence[str], None] = "be1c4ed95eaf"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index(
+        "ix_application_user_id_time_create",
+        "application",
+        ["user_id", sa.text("time_create DESC"), sa.text("id DESC")],
+        unique=False,
+    )
+    op.create_index(
+        "ix_application_user_id_time_update",
+        "application",
+        ["user_id", sa.text("time_update DESC"), sa.text("id DESC")],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("ix_application_user_id_time_update", table_name="application")
+    op.drop_index("ix_application_user_id_time_create", table_name="application")
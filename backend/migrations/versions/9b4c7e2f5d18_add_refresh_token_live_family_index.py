@@ -0,0 +1,36 @@
+"""Add refresh token live family index
+
+Revision ID: 9b4c7e2f5d18
+Revises: 3f9e6b1d2a74
+Create Date: 2026-10-18 17:22:46.801934
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "9b4c7e2f5d18"
+down_revision: Union[str, Sequence[str], None] = "3f9e6b1d2a74"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index(
+        "ix_refresh_token_family_id_live",
+        "refresh_token",
+        ["family_id"],
+        unique=False,
+        postgresql_where=sa.text("revoked_at IS NULL"),
+    )
+    op.drop_index(op.f("ix_refresh_token_family_id"), table_name="refresh_token")
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.create_index(op.f("ix_refresh_token_family_id"), "refresh_token", ["family_id"], unique=False)
+    op.drop_index("ix_refresh_token_family_id_live", table_name="refresh_token")
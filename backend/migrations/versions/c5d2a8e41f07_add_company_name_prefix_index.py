@@ -0,0 +1,33 @@
+"""Add company name prefix index
+
+Revision ID: c5d2a8e41f07
+Revises: 71346c9b0e37
+Create Date: 2026-10-18 14:26:53.118402
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "c5d2a8e41f07"
+down_revision: Union[str, Sequence[str], None] = "71346c9b0e37"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index(
+        "ix_company_name_lower_pattern",
+        "company",
+        [sa.text("lower(name) text_pattern_ops")],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("ix_company_name_lower_pattern", table_name="company")
@@ -0,0 +1,38 @@
+"""Make verification token user_id unique
+
+Revision ID: d7a15c3e8b62
+Revises: 9b4c7e2f5d18
+Create Date: 2026-10-18 18:05:37.146820
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "d7a15c3e8b62"
+down_revision: Union[str, Sequence[str], None] = "9b4c7e2f5d18"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Keep only the newest token of each user; older ones were already superseded when it was issued
+    op.execute(
+        """
+        DELETE FROM verification_token AS older
+        USING verification_token AS newer
+        WHERE older.user_id = newer.user_id
+          AND (older.time_create, older.id) < (newer.time_create, newer.id)
+        """
+    )
+    op.drop_index(op.f("ix_verification_token_user_id"), table_name="verification_token")
+    op.create_index(op.f("ix_verification_token_user_id"), "verification_token", ["user_id"], unique=True)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(op.f("ix_verification_token_user_id"), table_name="verification_token")
+    op.create_index(op.f("ix_verification_token_user_id"), "verification_token", ["user_id"], unique=False)
@@ -0,0 +1,68 @@
+from __future__ import annotations
+
+import argparse
+import asyncio
+import sys
+from datetime import UTC, datetime, timedelta
+from pathlib import Path
+
+from environs import Env
+from sqlalchemy import URL
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+
+ROOT_DIR = Path(__file__).resolve().parents[1]
+if str(ROOT_DIR) not in sys.path:
+    sys.path.insert(0, str(ROOT_DIR))
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Delete expired and revoked refresh tokens in batches.")
+    parser.add_argument("--batch-size", type=int, default=1000, help="Rows deleted per transaction")
+    parser.add_argument(
+        "--keep-days",
+        type=float,
+        default=1,
+        help="Keep tokens that expired or were revoked less than this many days ago",
+    )
+    parser.add_argument("--pause", type=float, default=0.1, help="Seconds to sleep between batches")
+    return parser.parse_args()
+
+
+async def main(args: argparse.Namespace) -> None:
+    from app.infrastructure.repositories import RefreshTokenSQLAlchemyRepository
+
+    env = Env()
+    env.read_env(path=str(ROOT_DIR / ".env"), recurse=False)
+
+    url_object = URL.create(
+        "postgresql+asyncpg",
+        env.str("POSTGRES_USER"),
+        env.str("POSTGRES_PASSWORD"),
+        env.str("POSTGRES_HOST"),
+        env.int("POSTGRES_PORT"),
+        env.str("POSTGRES_DB"),
+    )
+
+    engine = create_async_engine(url_object, echo=env.bool("PRINT_SQL_QUERIES", False))
+    before = datetime.now(UTC) - timedelta(days=args.keep_days)
+
+    total = 0
+    while True:
+        # One short transaction per batch keeps locks and WAL bursts small while the app keeps running
+        async with AsyncSession(engine) as session, session.begin():
+            deleted = await RefreshTokenSQLAlchemyRepository(session).delete_stale(before, args.batch_size)
+        total += deleted
+        if deleted < args.batch_size:
+            break
+        await asyncio.sleep(args.pause)
+
+    await engine.dispose()
+    print(f"Deleted {total} refresh tokens that expired or were revoked before {before.isoformat()}")
+
+
+def run() -> None:
+    asyncio.run(main(parse_args()))
+
+
+if __name__ == "__main__":
+    run()